@@ -6,6 +6,7 @@ from .exceptions import (
     NoVoicesError,
     NoPlayersError,
     UserCancelledError,
+    NoTerminalError,
     ExtractionError,
     DownloadError,
 )
@@ -23,6 +24,7 @@ __all__ = [
     "NoVoicesError",
     "NoPlayersError",
     "UserCancelledError",
+    "NoTerminalError",
     "ExtractionError",
     "DownloadError",
     # Main classes
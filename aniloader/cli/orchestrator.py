@@ -1,6 +1,7 @@
 """Download orchestrator coordinating the entire download process."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 from ..downloading.video_downloader_refactored import VideoDownloader
@@ -20,6 +21,7 @@ class DownloadOrchestrator:
         extractor: M3U8Extractor,
         downloader: VideoDownloader,
         selector: InteractiveSelector,
+        parallel_episodes: int = 3,
     ):
         """Initialize orchestrator with dependencies.
 
@@ -28,11 +30,13 @@ class DownloadOrchestrator:
             extractor: M3U8 URL extractor
             downloader: Video downloader
             selector: Interactive selector
+            parallel_episodes: Number of episodes to download concurrently
         """
         self.scraper = scraper
         self.extractor = extractor
         self.downloader = downloader
         self.selector = selector
+        self.parallel_episodes = max(1, parallel_episodes)
 
     def run(
         self,
@@ -50,7 +54,7 @@ class DownloadOrchestrator:
             output_dir: Output directory path
 
         Returns:
-            Statistics dictionary with successful/failed counts
+            Statistics dictionary with successful/failed/skipped counts
         """
         # Step 1: Fetch anime metadata
         print(f"\nFetching anime metadata from {url}...")
@@ -74,16 +78,15 @@ class DownloadOrchestrator:
             print("No voices/players found!")
             return {"successful": 0, "failed": 0}
 
-        print(
-            f"\nFound {len(anime.voices)} {'player' if anime.is_movie else 'voice'} options"
-        )
+        voice_label = "player" if anime.is_movie else "voice"
+        print(f"\nFound {len(anime.voices)} {voice_label} options")
 
         # Select voice
         if voice_index is not None:
             # Use provided voice index
             if 1 <= voice_index <= len(anime.voices):
                 voice = anime.voices[voice_index - 1]
-                print(f"Using {'player' if anime.is_movie else 'voice'}: {voice.name}")
+                print(f"Using {voice_label}: {voice.name}")
             else:
                 print(
                     f"Invalid voice index {voice_index}. Please use 1-{len(anime.voices)}"
@@ -118,48 +121,88 @@ class DownloadOrchestrator:
 
         print(f"Found {len(anime.episodes)} episodes")
 
-        # Step 5: Extract m3u8 URLs
-        print("\nExtracting video URLs...")
-        anime.episodes = self.extractor.extract_all_m3u8_urls(anime.episodes)
+        # Step 5: Create output directory
+        output_path = self.downloader.create_output_directory(anime, output_dir)
+        print(f"\nOutput directory: {output_path}")
 
-        # Filter episodes with successful extraction
-        episodes_to_download = [ep for ep in anime.episodes if ep.m3u8_url]
+        # Skip episodes that already exist before spending requests on them,
+        # checked against one directory listing instead of a stat per episode
+        existing = self.downloader.list_existing_files(output_path)
+        pending = [
+            ep
+            for ep in anime.episodes
+            if not self.downloader.is_downloaded(
+                anime, ep, output_path, existing=existing
+            )
+        ]
+        skipped = len(anime.episodes) - len(pending)
 
-        if not episodes_to_download:
-            print("Failed to extract any video URLs!")
-            return {"successful": 0, "failed": 0}
+        if skipped:
+            print(f"Skipping {skipped} already downloaded episodes")
 
-        print(
-            f"Successfully extracted {len(episodes_to_download)}/{len(anime.episodes)} URLs"
-        )
+        if not pending:
+            print("All episodes already downloaded!")
+            return {"successful": 0, "failed": 0, "skipped": skipped}
 
-        # Step 6: Create output directory
-        output_path = self.downloader.create_output_directory(anime, output_dir)
-        print(f"\nOutput directory: {output_path}")
-
-        # Step 7: Download episodes
-        print(f"\nDownloading {len(episodes_to_download)} episodes...")
+        # Step 6: Extract m3u8 URLs and start each download as soon as its
+        # URL is ready, so extraction overlaps with the first downloads
+        print("\nExtracting video URLs...")
 
         successful = 0
         failed = 0
-
-        for episode in episodes_to_download:
-            print(f"\n[{episode.number}/{len(episodes_to_download)}] ", end="")
-            success, message = self.downloader.download_episode(
-                anime, episode, output_path
-            )
-
-            if success:
-                successful += 1
-            else:
-                failed += 1
-                print(f"  Error: {message}")
+        total = len(anime.episodes)
+
+        # Each download runs an external yt-dlp process, so threads only wait
+        with ThreadPoolExecutor(max_workers=self.parallel_episodes) as executor:
+            try:
+                futures = {}
+                for episode in self.extractor.iter_m3u8_urls(pending):
+                    if episode.m3u8_url:
+                        future = executor.submit(
+                            self.downloader.download_episode,
+                            anime,
+                            episode,
+                            output_path,
+                        )
+                        futures[future] = episode
+
+                if not futures:
+                    print("Failed to extract any video URLs!")
+                    return {"successful": 0, "failed": 0, "skipped": skipped}
+
+                print(f"Successfully extracted {len(futures)}/{len(pending)} URLs")
+
+                # Step 7: Wait for downloads
+                print(f"\nDownloading {len(futures)} episodes...")
+
+                # Results are reported from this thread only, so output never
+                # interleaves
+                for future in as_completed(futures):
+                    episode = futures[future]
+                    success, message = future.result()
+
+                    # Flush so progress shows up as each download finishes,
+                    # even when stdout is piped and block-buffered
+                    print(f"\n[{episode.number}/{total}] ", end="")
+                    if success:
+                        successful += 1
+                        print(message, flush=True)
+                    else:
+                        failed += 1
+                        print(f"  Error: {message}", flush=True)
+            except BaseException:
+                # Ctrl+C: drop queued downloads instead of starting a yt-dlp
+                # process for each of them while the executor shuts down
+                executor.shutdown(cancel_futures=True)
+                raise
 
         # Step 8: Show summary
         print("\n" + "=" * 50)
         print("Download complete!")
         print(f"Successful: {successful}")
         print(f"Failed: {failed}")
+        if skipped:
+            print(f"Skipped (already downloaded): {skipped}")
         print("=" * 50)
 
-        return {"successful": successful, "failed": failed}
+        return {"successful": successful, "failed": failed, "skipped": skipped}
@@ -1,9 +1,15 @@
 """Interactive selection UI for voices and players."""
 
 import logging
+import sys
 
 from ..models import Voice, Player
-from ..exceptions import NoVoicesError, NoPlayersError, UserCancelledError
+from ..exceptions import (
+    NoVoicesError,
+    NoPlayersError,
+    NoTerminalError,
+    UserCancelledError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,7 @@ class InteractiveSelector:
         Raises:
             NoVoicesError: If no voices available
             UserCancelledError: If user cancels
+            NoTerminalError: If there is no terminal to ask
         """
         if not voices:
             raise NoVoicesError("No voice options found")
@@ -31,6 +38,12 @@ class InteractiveSelector:
             print(f"Using only available voice: {voices[0].name}")
             return voices[0]
 
+        # Without a terminal input() would block forever (e.g. piped or in CI)
+        if not sys.stdin.isatty():
+            raise NoTerminalError(
+                "Cannot ask for voice without a terminal, use --voice to select one"
+            )
+
         print("\nAvailable voice options:")
         for idx, voice in enumerate(voices, start=1):
             print(f"  {idx}. {voice.name}")
@@ -72,6 +85,11 @@ class InteractiveSelector:
             print(f"Using only available player: {players[0].name}")
             return players[0]
 
+        # Without a terminal, take the same default as pressing Enter
+        if not sys.stdin.isatty():
+            print(f"Using first player: {players[0].name}")
+            return players[0]
+
         print("\nAvailable players:")
         for idx, player in enumerate(players, start=1):
             print(f"  {idx}. {player.name}")
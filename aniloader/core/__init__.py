@@ -1,7 +1,9 @@
 """Core components."""
 
+from .http_cache import HTTPCache
 from .http_client import HTTPClient
 
 __all__ = [
+    "HTTPCache",
     "HTTPClient",
 ]
@@ -0,0 +1,135 @@
+"""On-disk cache for HTTP response bodies."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "aniloader" / "http"
+
+
+class HTTPCache:
+    """Gzip-compressed response body cache with time-based expiry."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: float = 6 * 60 * 60):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache files
+            ttl: Time in seconds after which cached entries expire
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+
+    def make_key(self, url: str) -> str:
+        """Build cache key for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Hex digest identifying the request
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get cache file path for key."""
+        return self.cache_dir / f"{key}.html.gz"
+
+    def _meta_path(self, key: str) -> Path:
+        """Get validator sidecar file path for key."""
+        return self.cache_dir / f"{key}.meta.json"
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[str]:
+        """Get cached body if present and not expired.
+
+        Args:
+            key: Cache key from make_key
+            allow_expired: Return the body even if older than ttl, used
+                when the server confirmed it is still current
+
+        Returns:
+            Cached body or None on miss
+        """
+        path = self._path(key)
+        try:
+            if not allow_expired and time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            return gzip.decompress(path.read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, UnicodeDecodeError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def get_validators(self, key: str) -> dict:
+        """Get conditional request headers for an expired entry.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, empty if the entry
+            has no stored validators
+        """
+        try:
+            meta = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def set(
+        self,
+        key: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store body in cache.
+
+        Args:
+            key: Cache key from make_key
+            body: Response body to store
+            etag: ETag response header for later revalidation
+            last_modified: Last-Modified response header for later revalidation
+        """
+        path = self._path(key)
+        meta_path = self._meta_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(gzip.compress(body.encode("utf-8")))
+            # Atomic rename so readers never see a partially written file
+            os.replace(tmp_path, path)
+
+            if etag or last_modified:
+                meta = {"etag": etag, "last_modified": last_modified}
+                meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            else:
+                # Validators of a previous body don't apply to this one
+                meta_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Failed to write cache entry {path}: {e}")
+
+    def touch(self, key: str) -> None:
+        """Mark entry as fresh again after successful revalidation.
+
+        Args:
+            key: Cache key from make_key
+        """
+        try:
+            os.utime(self._path(key))
+        except OSError as e:
+            logger.debug(f"Failed to refresh cache entry {key}: {e}")
@@ -2,24 +2,82 @@
 
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
+
+from .http_cache import HTTPCache
 
 logger = logging.getLogger(__name__)
 
 
+def create_retrying_adapter(pool_maxsize: int) -> HTTPAdapter:
+    """Create an adapter that retries transient gateway errors.
+
+    Once retries are exhausted the last response is returned rather than
+    raising RetryError, so callers still get requests.HTTPError from
+    raise_for_status().
+
+    Args:
+        pool_maxsize: Maximum number of kept-alive connections per host
+
+    Returns:
+        Configured HTTPAdapter
+    """
+    return HTTPAdapter(
+        pool_maxsize=max(1, pool_maxsize),
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+
+
+def _response_text(response: requests.Response) -> str:
+    """Decode response body, as UTF-8 unless the server declares a charset.
+
+    Without a declared charset requests falls back to ISO-8859-1 for text/*
+    responses and to charset detection over the whole body otherwise. The
+    site serves UTF-8, so use that in both cases.
+    """
+    if "charset=" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = "utf-8"
+    return response.text
+
+
 class HTTPClient:
     """HTTP client for making requests to anitube.in.ua with proper headers."""
 
     BASE_URL = "https://anitube.in.ua"
     AJAX_PLAYLIST_URL = f"{BASE_URL}/engine/ajax/playlists.php"
 
-    def __init__(self):
-        """Initialize HTTP client with configured session."""
+    # (connect, read) timeout in seconds applied when callers don't pass one
+    DEFAULT_TIMEOUT = (10, 60)
+
+    def __init__(self, pool_size: int = 16, cache: Optional[HTTPCache] = None):
+        """Initialize HTTP client with configured session.
+
+        Args:
+            pool_size: Maximum number of kept-alive connections per host,
+                should cover the number of concurrent requests
+            cache: Optional on-disk cache for page responses
+        """
         self._session = requests.Session()
+        self._pool_size = pool_size
+        self._cache = cache
         self._configure_session()
 
     def _configure_session(self) -> None:
-        """Configure session with headers needed to bypass Cloudflare."""
+        """Configure connection pool and headers needed to bypass Cloudflare."""
+        # One shared connection pool so concurrent requests reuse TCP/TLS.
+        # Gateway errors are retried for GETs only; urllib3 retries the
+        # playlist POST on connection errors but never on a status code
+        adapter = create_retrying_adapter(self._pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
         self._session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -56,10 +114,69 @@ class HTTPClient:
             requests.HTTPError: If request fails
         """
         logger.debug(f"GET request to {url}")
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
         response = self._session.get(url, **kwargs)
         response.raise_for_status()
         return response
 
+    def get_text(self, url: str, use_cache: bool = True) -> str:
+        """Fetch page body, served from cache when available.
+
+        Args:
+            url: URL to fetch
+            use_cache: Whether the cache may be used for this request
+
+        Returns:
+            Response body
+
+        Raises:
+            requests.HTTPError: If request fails
+        """
+        return self.fetch_text(url, use_cache)[0]
+
+    def fetch_text(self, url: str, use_cache: bool = True) -> tuple[str, bool]:
+        """Fetch page body and tell whether it was served from cache.
+
+        Args:
+            url: URL to fetch
+            use_cache: Whether the cache may be used for this request
+
+        Returns:
+            Response body, and True if it came from the cache (fresh or
+            revalidated)
+
+        Raises:
+            requests.HTTPError: If request fails
+        """
+        cache = self._cache if use_cache else None
+        if not cache:
+            return _response_text(self.get(url)), False
+
+        key = cache.make_key(url)
+        body = cache.get(key)
+        if body is not None:
+            logger.debug(f"Cache hit for {url}")
+            return body, True
+
+        # Expired entry: revalidate so an unchanged page costs no body transfer
+        headers = cache.get_validators(key)
+        stale_body = cache.get(key, allow_expired=True) if headers else None
+        response = self.get(url, headers=headers if stale_body is not None else None)
+
+        if response.status_code == 304 and stale_body is not None:
+            logger.debug(f"Cache revalidated for {url}")
+            cache.touch(key)
+            return stale_body, True
+
+        body = _response_text(response)
+        cache.set(
+            key,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return body, False
+
     def post(
         self, url: str, data: Optional[dict] = None, **kwargs
     ) -> requests.Response:
@@ -77,6 +194,7 @@ class HTTPClient:
             requests.HTTPError: If request fails
         """
         logger.debug(f"POST request to {url}")
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
         response = self._session.post(url, data=data, **kwargs)
         response.raise_for_status()
         return response
@@ -101,6 +219,8 @@ class HTTPClient:
             "Referer": referer,
             "X-Requested-With": "XMLHttpRequest",
         }
+        # Never cached: the playlist is how new episodes are discovered, and a
+        # rejected response must not outlive the request that produced it
         logger.debug(f"AJAX playlist request for news_id={news_id}")
         response = self.post(self.AJAX_PLAYLIST_URL, data=data, headers=headers)
-        return response.text
+        return _response_text(response)
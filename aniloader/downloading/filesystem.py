@@ -1,13 +1,35 @@
 """Filesystem operations for downloads."""
 
+import os
 import re
+import stat
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from ..models import Anime, Episode
 
 logger = logging.getLogger(__name__)
 
+# Invalid character replacements, applied in one regex pass instead of one
+# str.replace scan per character
+_FILENAME_REPLACEMENTS = {
+    ":": " -",  # Colon → space + dash (common in subtitles like "Book 1: Water")
+    "/": "-",  # Forward slash
+    "\\": "-",  # Backslash
+    "|": "-",  # Pipe
+    "?": "",  # Question mark
+    "*": "",  # Asterisk
+    "<": "",  # Less than
+    ">": "",  # Greater than
+    '"': "'",  # Double quote → single quote
+}
+
+_INVALID_CHARS_RE = re.compile("[" + re.escape("".join(_FILENAME_REPLACEMENTS)) + "]")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def sanitize_filename(filename: str) -> str:
     """Remove or replace invalid characters in filenames.
@@ -18,35 +40,46 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for all filesystems
     """
-    # Replace problematic characters
-    replacements = {
-        ":": " -",  # Colon → space + dash (common in subtitles like "Book 1: Water")
-        "/": "-",  # Forward slash
-        "\\": "-",  # Backslash
-        "|": "-",  # Pipe
-        "?": "",  # Question mark
-        "*": "",  # Asterisk
-        "<": "",  # Less than
-        ">": "",  # Greater than
-        '"': "'",  # Double quote → single quote
-    }
-
-    result = filename
-    for char, replacement in replacements.items():
-        result = result.replace(char, replacement)
+    result = _INVALID_CHARS_RE.sub(
+        lambda match: _FILENAME_REPLACEMENTS[match.group()], filename
+    )
 
     # Remove leading/trailing spaces and dots (problematic on Windows)
     result = result.strip(". ")
 
-    # Collapse multiple spaces
-    result = re.sub(r"\s+", " ", result)
+    # Collapse multiple spaces. Every whitespace character except " " is
+    # non-printable, so a printable string without double spaces needs no regex
+    if result.isprintable() and "  " not in result:
+        return result
+    return _WHITESPACE_RE.sub(" ", result)
 
-    return result
+
+@lru_cache(maxsize=128)
+def _series_filename_prefix(title: str, season: int) -> str:
+    """Get sanitized "Title S01" prefix shared by all episodes of a season.
+
+    Episode suffixes ("E01.mp4") contain no characters sanitize_filename
+    changes, so only the prefix needs sanitizing.
+    """
+    return sanitize_filename(f"{title} S{season:02d}")
+
+
+@lru_cache(maxsize=128)
+def _movie_filename(title: str, year: Optional[int]) -> str:
+    """Get sanitized "Title (Year).mp4" movie filename."""
+    if year:
+        return sanitize_filename(f"{title} ({year}).mp4")
+    return sanitize_filename(f"{title}.mp4")
 
 
 class FileSystemManager:
     """Manager for filesystem operations."""
 
+    def __init__(self):
+        """Initialize manager."""
+        # Directories already created by this manager
+        self._created_dirs: set[Path] = set()
+
     def create_output_directory(self, anime: Anime, base_dir: str) -> Path:
         """Create and return output directory for anime or movie.
 
@@ -72,8 +105,12 @@ class FileSystemManager:
             season_folder = f"Season {anime.season:02d}"
             output_path = Path(base_dir) / series_name / season_folder
 
+        if output_path in self._created_dirs:
+            return output_path
+
         output_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created output directory: {output_path}")
+        self._created_dirs.add(output_path)
+        logger.info("Created output directory: %s", output_path)
 
         return output_path
 
@@ -86,7 +123,30 @@ class FileSystemManager:
         Returns:
             True if file exists
         """
-        return path.exists() and path.is_file()
+        # One stat() call instead of separate exists() and is_file() calls
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return stat.S_ISREG(st.st_mode)
+
+    def list_files(self, directory: Path) -> set[str]:
+        """List names of files in directory.
+
+        Uses a single directory scan, so membership checks for many
+        episodes don't cost a stat() call each.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Set of file names, empty if directory doesn't exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
 
     def generate_episode_filename(self, anime: Anime, episode: Episode) -> str:
         """Generate filename for episode or movie.
@@ -102,15 +162,10 @@ class FileSystemManager:
         Returns:
             Generated filename
         """
-        if anime.is_movie:
-            # Movies: Movie Name (Year).mp4
-            if anime.year:
-                filename = f"{anime.title_en} ({anime.year}).mp4"
-            else:
-                filename = f"{anime.title_en}.mp4"
-        else:
+        if not anime.is_movie:
             # Series: Series Name S01E02.mp4
-            base_name = anime.title_en
-            filename = f"{base_name} S{anime.season:02d}E{episode.number:02d}.mp4"
+            prefix = _series_filename_prefix(anime.title_en, anime.season)
+            return f"{prefix}E{episode.number:02d}.mp4"
 
-        return sanitize_filename(filename)
+        # Movies: Movie Name (Year).mp4
+        return _movie_filename(anime.title_en, anime.year)
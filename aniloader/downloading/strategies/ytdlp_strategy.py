@@ -1,8 +1,12 @@
 """yt-dlp download strategy for HLS/m3u8 streams."""
 
+import os
 import subprocess
 import shutil
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 import logging
 
 from .base_strategy import BaseDownloadStrategy
@@ -10,20 +14,100 @@ from .base_strategy import BaseDownloadStrategy
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Resolve executable on $PATH, once per process."""
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=1)
+def _warn_aria2c_missing() -> None:
+    """Warn that aria2c is missing; cached so it's only logged once."""
+    logger.warning("aria2c not found, using yt-dlp's built-in downloader")
+
+
 class YtDlpStrategy(BaseDownloadStrategy):
     """Download strategy using yt-dlp for HLS streams."""
 
-    def __init__(self, use_aria2c_downloader: bool = True):
+    # Number of trailing stderr lines kept for error reporting
+    STDERR_TAIL_LINES = 200
+
+    FORMAT_ARGS = (
+        "--no-check-certificate",
+        "-f",
+        "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
+        "--merge-output-format",
+        "mp4",
+    )
+
+    @staticmethod
+    def _aria2c_args(connections: int) -> tuple[str, ...]:
+        """Build yt-dlp args that make aria2c the downloader.
+
+        Args:
+            connections: Connections aria2c may open per download
+
+        Returns:
+            yt-dlp command line arguments
+        """
+        return (
+            "--downloader",
+            "aria2c",
+            "--downloader-args",
+            f"aria2c:--min-split-size=1M --max-connection-per-server={connections} "
+            f"--split={connections}",
+        )
+
+    def __init__(
+        self, use_aria2c_downloader: bool = True, concurrent_fragments: int = 16
+    ):
         """Initialize strategy.
 
         Args:
             use_aria2c_downloader: Whether to use aria2c as yt-dlp's downloader
+            concurrent_fragments: Number of HLS fragments each download fetches
+                in parallel, also used as aria2c's connection and split count;
+                lower it when running several downloads at once
         """
         self.use_aria2c_downloader = use_aria2c_downloader
+        self.concurrent_fragments = concurrent_fragments
+
+        # Resolve binaries once instead of scanning $PATH for every episode
+        self._ytdlp_path: Optional[str] = _which("yt-dlp")
+        self._aria2c_path: Optional[str] = _which("aria2c")
+
+        if use_aria2c_downloader and not self._aria2c_path:
+            _warn_aria2c_missing()
+
+        # Everything except output path and URL is the same for every episode
+        self._base_cmd: tuple[str, ...] = (
+            self._ytdlp_path or "yt-dlp",
+            *self.FORMAT_ARGS,
+            "--concurrent-fragments",
+            str(concurrent_fragments),
+            # Use aria2c as downloader if available
+            *(
+                self._aria2c_args(concurrent_fragments)
+                if use_aria2c_downloader and self._aria2c_path
+                else ()
+            ),
+        )
 
     def is_available(self) -> bool:
         """Check if yt-dlp is available."""
-        return shutil.which("yt-dlp") is not None
+        return self._ytdlp_path is not None
+
+    def _build_command(self, url: str, output_path: Path) -> list[str]:
+        """Build yt-dlp command line for one download.
+
+        Args:
+            url: m3u8 URL
+            output_path: Path to save file
+
+        Returns:
+            Command arguments
+        """
+        return [*self._base_cmd, "-o", os.fspath(output_path), url]
 
     def download(self, url: str, output_path: Path) -> bool:
         """Download HLS stream using yt-dlp.
@@ -40,39 +124,33 @@ class YtDlpStrategy(BaseDownloadStrategy):
             return False
 
         try:
-            cmd = [
-                "yt-dlp",
-                "--no-check-certificate",
-                "-f",
-                "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
-                "--merge-output-format",
-                "mp4",
-                "--concurrent-fragments",
-                "16",
-            ]
-
-            # Use aria2c as downloader if available
-            if self.use_aria2c_downloader and shutil.which("aria2c"):
-                cmd.extend(
-                    [
-                        "--downloader",
-                        "aria2c",
-                        "--downloader-args",
-                        "aria2c:--min-split-size=1M --max-connection-per-server=16 --split=16",
-                    ]
-                )
-
-            cmd.extend(["-o", str(output_path), url])
-
-            logger.info(f"Downloading with yt-dlp: {url}")
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-
-            if result.returncode == 0:
-                logger.info(f"Downloaded successfully: {output_path}")
+            cmd = self._build_command(url, output_path)
+
+            logger.info("Downloading with yt-dlp: %s", url)
+
+            # Progress output is discarded; stderr is streamed line by line as
+            # raw bytes and only a bounded tail is kept for the error message,
+            # decoded only if it's actually needed
+            stderr_tail: deque[bytes] = deque(maxlen=self.STDERR_TAIL_LINES)
+            log_lines = logger.isEnabledFor(logging.DEBUG)
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            ) as process:
+                for line in process.stderr:
+                    stderr_tail.append(line)
+                    if log_lines:
+                        logger.debug(line.decode("utf-8", errors="replace").rstrip())
+                returncode = process.wait()
+
+            if returncode == 0:
+                logger.info("Downloaded successfully: %s", output_path)
                 return True
             else:
-                logger.error(f"yt-dlp failed: {result.stderr}")
+                stderr = b"".join(stderr_tail).decode("utf-8", errors="replace")
+                logger.error("yt-dlp failed: %s", stderr)
                 return False
         except OSError as e:
-            logger.error(f"Failed to run yt-dlp: {e}")
+            logger.error("Failed to run yt-dlp: %s", e)
             return False
@@ -31,6 +31,41 @@ class VideoDownloader:
         )
         self.fs_manager = fs_manager or FileSystemManager()
 
+    def is_downloaded(
+        self,
+        anime: Anime,
+        episode: Episode,
+        output_dir: Path,
+        existing: Optional[set[str]] = None,
+    ) -> bool:
+        """Check if episode file already exists in output directory.
+
+        Args:
+            anime: Anime object
+            episode: Episode to check
+            output_dir: Output directory
+            existing: Optional snapshot of file names from list_existing_files,
+                checked instead of the filesystem
+
+        Returns:
+            True if episode was already downloaded
+        """
+        filename = self.fs_manager.generate_episode_filename(anime, episode)
+        if existing is not None:
+            return filename in existing
+        return self.fs_manager.file_exists(output_dir / filename)
+
+    def list_existing_files(self, output_dir: Path) -> set[str]:
+        """Snapshot names of files already in output directory.
+
+        Args:
+            output_dir: Output directory
+
+        Returns:
+            Set of file names
+        """
+        return self.fs_manager.list_files(output_dir)
+
     def download_episode(
         self,
         anime: Anime,
@@ -47,23 +82,23 @@ class VideoDownloader:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if not episode.m3u8_url:
-            msg = f"Episode {episode.number} has no m3u8_url"
-            logger.warning(msg)
-            return False, msg
-
         # Generate filename
         filename = self.fs_manager.generate_episode_filename(anime, episode)
         output_path = output_dir / filename
 
-        # Check if already exists
+        # Check if already exists; an existing file needs no m3u8 URL
         if self.fs_manager.file_exists(output_path):
             msg = f"Skipping episode {episode.number} (already exists)"
             logger.info(msg)
             return True, msg
 
+        if not episode.m3u8_url:
+            msg = f"Episode {episode.number} has no m3u8_url"
+            logger.warning(msg)
+            return False, msg
+
         # Download
-        logger.info(f"Downloading episode {episode.number}: {filename}")
+        logger.info("Downloading episode %d: %s", episode.number, filename)
 
         try:
             success = self.download_strategy.download(episode.m3u8_url, output_path)
@@ -25,6 +25,12 @@ class UserCancelledError(AniloaderError):
     pass
 
 
+class NoTerminalError(AniloaderError):
+    """Raised when a choice must be asked but stdin is not a terminal."""
+
+    pass
+
+
 class ExtractionError(AniloaderError):
     """Raised when video URL extraction fails."""
 
@@ -2,9 +2,12 @@
 
 import re
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 import requests
 
+from ..core.http_client import create_retrying_adapter
 from ..models import Episode
 from .base_extractor import BaseVideoExtractor
 from .tortuga_extractor import TortugaCoreExtractor
@@ -12,21 +15,33 @@ from .playerjs_extractor import PlayerJSExtractor
 
 logger = logging.getLogger(__name__)
 
+# Multi-quality file option: [720p]url
+_QUALITY_RE = re.compile(r"\[(\d+)p\]([^,\[\]]+)")
+
 
 class M3U8Extractor:
     """Extractor for m3u8 URLs from video player pages."""
 
+    # Player config sits near the top of the page; don't read huge pages fully
+    MAX_PAGE_BYTES = 512 * 1024
+
+    # (connect, read) timeout so a stalled page doesn't hold a worker forever
+    REQUEST_TIMEOUT = (10, 30)
+
     def __init__(
         self,
         session: Optional[requests.Session] = None,
         extractors: Optional[list[BaseVideoExtractor]] = None,
+        max_workers: int = 10,
     ):
         """Initialize extractor.
 
         Args:
             session: HTTP session
             extractors: List of video extractors to try in order
+            max_workers: Maximum number of player pages fetched concurrently
         """
+        self.max_workers = max_workers
         self.session = session or self._create_default_session()
         self.extractors = extractors or [
             TortugaCoreExtractor(),  # Try newer player first
@@ -36,6 +51,12 @@ class M3U8Extractor:
     def _create_default_session(self) -> requests.Session:
         """Create default HTTP session."""
         session = requests.Session()
+        # Keep a connection per worker so concurrent extractions reuse TCP/TLS
+        # instead of discarding connections beyond the default pool of 10,
+        # and retry transient gateway errors from the player hosts
+        adapter = create_retrying_adapter(self.max_workers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -60,25 +81,26 @@ class M3U8Extractor:
         if not file_value:
             return file_value
 
-        # Check if this is multi-quality format
-        if "[" not in file_value or "]" not in file_value:
+        # Multi-quality values always start with "[NNNp]"; plain URLs never do
+        if not file_value.startswith("["):
             return file_value
 
-        # Parse quality options: [360p]url,[720p]url,[1080p]url
-        quality_pattern = r"\[(\d+)p\]([^,\[\]]+)"
-        matches = re.findall(quality_pattern, file_value)
+        # Parse quality options: [360p]url,[720p]url,[1080p]url, keeping only
+        # the highest seen so far; first one wins on ties
+        best_quality = -1
+        best_url = ""
+        for match in _QUALITY_RE.finditer(file_value):
+            quality = int(match.group(1))
+            if quality > best_quality:
+                best_quality, best_url = quality, match.group(2)
 
-        if not matches:
+        if best_quality < 0:
             return file_value
 
-        # Sort by quality (descending) and pick highest
-        sorted_qualities = sorted(matches, key=lambda x: int(x[0]), reverse=True)
-        best_quality, best_url = sorted_qualities[0]
-
         # Remove trailing slash if present
         best_url = best_url.rstrip("/")
 
-        logger.info(f"Selected {best_quality}p quality from available options")
+        logger.info("Selected %sp quality from available options", best_quality)
         return best_url
 
     def _extract_from_html(self, html: str) -> Optional[str]:
@@ -91,22 +113,50 @@ class M3U8Extractor:
             Extracted URL or None if all extractors fail
         """
         for extractor in self.extractors:
+            name = type(extractor).__name__
             if not extractor.can_handle(html):
-                logger.debug(
-                    f"{extractor.__class__.__name__} cannot handle this content"
-                )
+                logger.debug("%s cannot handle this content", name)
                 continue
 
             url = extractor.extract_url(html)
             if url:
-                logger.info(
-                    f"Successfully extracted URL using {extractor.__class__.__name__}"
-                )
+                logger.info("Successfully extracted URL using %s", name)
                 return url
 
         logger.warning("No extractor could extract URL")
         return None
 
+    def _fetch_page(self, url: str, headers: dict[str, str]) -> str:
+        """Fetch player page, reading at most MAX_PAGE_BYTES.
+
+        Args:
+            url: Player page URL
+            headers: Request headers
+
+        Returns:
+            Decoded (possibly truncated) page HTML
+
+        Raises:
+            requests.RequestException: If request fails
+        """
+        with self.session.get(
+            url, headers=headers, stream=True, timeout=self.REQUEST_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= self.MAX_PAGE_BYTES:
+                    logger.debug("Page %s truncated at %d bytes", url, total)
+                    break
+
+            encoding = response.encoding or "utf-8"
+
+        return b"".join(chunks).decode(encoding, errors="replace")
+
     def extract_m3u8_url(self, episode: Episode) -> Optional[str]:
         """Extract m3u8 URL from episode's data_file iframe.
 
@@ -117,7 +167,7 @@ class M3U8Extractor:
             Extracted m3u8 URL or None
         """
         if not episode.data_file:
-            logger.warning(f"Episode {episode.number} has no data_file URL")
+            logger.warning("Episode %d has no data_file URL", episode.number)
             return None
 
         try:
@@ -125,15 +175,14 @@ class M3U8Extractor:
             headers = {
                 "Referer": "https://anitube.in.ua/",
             }
-            response = self.session.get(episode.data_file, headers=headers)
-            response.raise_for_status()
-            html = response.text
+            html = self._fetch_page(episode.data_file, headers)
 
             # Check if response is valid
             if not html or len(html) < 100:
                 logger.error(
-                    f"Empty or too short response for episode {episode.number} "
-                    f"(got {len(html)} bytes)"
+                    "Empty or too short response for episode %d (got %d bytes)",
+                    episode.number,
+                    len(html),
                 )
                 return None
 
@@ -141,19 +190,55 @@ class M3U8Extractor:
             m3u8_url = self._extract_from_html(html)
 
             if not m3u8_url:
-                logger.warning(f"Could not extract URL for episode {episode.number}")
+                logger.warning("Could not extract URL for episode %d", episode.number)
                 return None
 
             # Select best quality if multi-quality format
             m3u8_url = self._select_best_quality(m3u8_url)
 
-            logger.info(f"Extracted m3u8 URL for episode {episode.number}: {m3u8_url}")
+            logger.info(
+                "Extracted m3u8 URL for episode %d: %s", episode.number, m3u8_url
+            )
             return m3u8_url
 
         except Exception as e:
-            logger.error(f"Failed to extract URL for episode {episode.number}: {e}")
+            logger.error("Failed to extract URL for episode %d: %s", episode.number, e)
             return None
 
+    def iter_m3u8_urls(self, episodes: list[Episode]) -> Iterator[Episode]:
+        """Extract m3u8 URLs concurrently, yielding episodes as they finish.
+
+        Lets callers start working on an episode (e.g. downloading it) while
+        the remaining extractions are still in flight.
+
+        Args:
+            episodes: List of episodes
+
+        Yields:
+            Episodes with m3u8_url populated (None if extraction failed),
+            in completion order
+        """
+        if not episodes:
+            return
+
+        # Each extraction is one blocking round-trip, so overlap them
+        workers = max(1, min(self.max_workers, len(episodes)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.extract_m3u8_url, episode): episode
+                for episode in episodes
+            }
+            try:
+                for future in as_completed(futures):
+                    episode = futures[future]
+                    episode.m3u8_url = future.result()
+                    yield episode
+            except BaseException:
+                # Ctrl+C or the caller closing the generator early: don't
+                # run the remaining extractions during shutdown
+                executor.shutdown(cancel_futures=True)
+                raise
+
     def extract_all_m3u8_urls(self, episodes: list[Episode]) -> list[Episode]:
         """Extract m3u8 URLs for all episodes.
 
@@ -163,13 +248,13 @@ class M3U8Extractor:
         Returns:
             List of episodes with m3u8_url populated
         """
-        logger.info(f"Extracting m3u8 URLs for {len(episodes)} episodes")
+        logger.info("Extracting m3u8 URLs for %d episodes", len(episodes))
 
-        for episode in episodes:
-            m3u8_url = self.extract_m3u8_url(episode)
-            episode.m3u8_url = m3u8_url
+        # Drain the generator; it sets m3u8_url on each episode in place
+        for _ in self.iter_m3u8_urls(episodes):
+            pass
 
         successful = sum(1 for ep in episodes if ep.m3u8_url)
-        logger.info(f"Successfully extracted {successful}/{len(episodes)} URLs")
+        logger.info("Successfully extracted %d/%d URLs", successful, len(episodes))
 
         return episodes
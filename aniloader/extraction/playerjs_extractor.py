@@ -9,6 +9,62 @@ from .base_extractor import BaseVideoExtractor
 
 logger = logging.getLogger(__name__)
 
+# Start of a Playerjs({...}) call, up to and including the opening brace
+_PLAYERJS_CALL_RE = re.compile(r"Playerjs\s*\(\s*\{")
+
+# file: "url" field in a (possibly non-standard JSON) config
+_FILE_RE = re.compile(r'file["\']?\s*:\s*["\']([^"\']+)["\']')
+
+# Single-quoted keys ('file':) and simple values (: 'x'); the key branch
+# leaves the colon unconsumed so the value after it can match too
+_SINGLE_QUOTED_RE = re.compile(r"'(\w+)'(?=\s*:)|:\s*'([^']*)'")
+
+
+def _to_double_quotes(match: re.Match) -> str:
+    """Rewrite a single-quoted key or value match with JSON double quotes."""
+    if match.group(1) is not None:
+        return f'"{match.group(1)}"'
+    return f': "{match.group(2)}"'
+
+
+def _slice_config(html: str) -> Optional[str]:
+    """Find the Playerjs({...}) config object with a brace-balanced scan.
+
+    Unlike a regex this handles nested objects and braces inside string
+    values in a single linear pass.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        Config object source including braces, or None if not found
+    """
+    for call in _PLAYERJS_CALL_RE.finditer(html):
+        start = call.end() - 1
+        depth = 0
+        quote = None
+        escaped = False
+
+        for pos in range(start, len(html)):
+            char = html[pos]
+            if quote:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return html[start : pos + 1]
+
+    return None
+
 
 class PlayerJSExtractor(BaseVideoExtractor):
     """Extractor for PlayerJS player."""
@@ -27,37 +83,28 @@ class PlayerJSExtractor(BaseVideoExtractor):
             Extracted m3u8 URL or None
         """
         # Pattern: Playerjs({...})
-        pattern = r"Playerjs\s*\(\s*(\{[^}]+\})\s*\)"
-        match = re.search(pattern, html, re.DOTALL)
-
-        if not match:
-            # Try alternative pattern with more content
-            pattern = r"Playerjs\s*\(\s*(\{[\s\S]*?\})\s*\)"
-            match = re.search(pattern, html)
+        json_str = _slice_config(html)
 
-        if not match:
+        if not json_str:
             logger.debug("No PlayerJS configuration found")
             return None
 
-        json_str = match.group(1)
-
         # First try regex extraction - more reliable than JSON parsing
         # because PlayerJS configs often have non-standard JSON (single quotes,
         # apostrophes in values like "It's working")
-        file_match = re.search(r'file["\']?\s*:\s*["\']([^"\']+)["\']', json_str)
+        file_match = _FILE_RE.search(json_str)
         if file_match:
             m3u8_url = file_match.group(1)
             m3u8_url = self.normalize_url(m3u8_url)
-            logger.info(f"Extracted URL from PlayerJS via regex: {m3u8_url}")
+            logger.info("Extracted URL from PlayerJS via regex: %s", m3u8_url)
             return m3u8_url
 
         # Fallback: try JSON parsing with careful quote replacement
         # Only replace quotes that are likely JSON delimiters (around keys)
         try:
-            # Replace single quotes around keys: 'file': -> "file":
-            json_str_cleaned = re.sub(r"'(\w+)'(\s*:)", r'"\1"\2', json_str)
-            # Replace single quotes around simple values (no apostrophes)
-            json_str_cleaned = re.sub(r":\s*'([^']*)'", r': "\1"', json_str_cleaned)
+            # Replace single quotes around keys ('file': -> "file":) and
+            # around simple values without apostrophes, in one pass
+            json_str_cleaned = _SINGLE_QUOTED_RE.sub(_to_double_quotes, json_str)
 
             config = json.loads(json_str_cleaned)
             file_value = config.get("file", "")
@@ -67,10 +114,10 @@ class PlayerJSExtractor(BaseVideoExtractor):
                 return None
 
             m3u8_url = self.normalize_url(file_value)
-            logger.info(f"Extracted URL from PlayerJS via JSON: {m3u8_url}")
+            logger.info("Extracted URL from PlayerJS via JSON: %s", m3u8_url)
             return m3u8_url
 
         except json.JSONDecodeError as e:
-            logger.debug(f"JSON parsing also failed: {e}")
+            logger.debug("JSON parsing also failed: %s", e)
             logger.warning("Failed to extract file from PlayerJS config")
             return None
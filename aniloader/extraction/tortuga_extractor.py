@@ -9,6 +9,11 @@ from .base_extractor import BaseVideoExtractor
 
 logger = logging.getLogger(__name__)
 
+# new TortugaCore({ ... file: "base64encoded" ... })
+_TORTUGA_FILE_RE = re.compile(
+    r'new\s+TortugaCore\s*\(\s*\{[^}]*file\s*:\s*["\']([^"\']+)["\']', re.DOTALL
+)
+
 
 class TortugaCoreExtractor(BaseVideoExtractor):
     """Extractor for TortugaCore player."""
@@ -28,9 +33,7 @@ class TortugaCoreExtractor(BaseVideoExtractor):
         Returns:
             Decoded m3u8 URL or None
         """
-        # Pattern: new TortugaCore({ ... file: "base64encoded" ... })
-        pattern = r'new\s+TortugaCore\s*\(\s*\{[^}]*file\s*:\s*["\']([^"\']+)["\']'
-        match = re.search(pattern, html, re.DOTALL)
+        match = _TORTUGA_FILE_RE.search(html)
 
         if not match:
             logger.debug("No TortugaCore file pattern found")
@@ -39,16 +42,16 @@ class TortugaCoreExtractor(BaseVideoExtractor):
         encoded_file = match.group(1)
 
         try:
-            # Decode: base64 decode -> reverse string
-            decoded = base64.b64decode(encoded_file).decode("utf-8")
-            m3u8_url = decoded[::-1]  # Reverse the string
+            # Decode: base64 decode -> reverse string. URLs are ASCII, so
+            # reverse the raw bytes and decode once
+            m3u8_url = base64.b64decode(encoded_file)[::-1].decode("ascii")
 
             # Normalize URL
             m3u8_url = self.normalize_url(m3u8_url)
 
-            logger.info(f"Extracted URL from TortugaCore: {m3u8_url}")
+            logger.info("Extracted URL from TortugaCore: %s", m3u8_url)
             return m3u8_url
         except (ValueError, UnicodeDecodeError) as e:
             # ValueError covers base64.binascii.Error (it's a subclass)
-            logger.warning(f"Failed to decode TortugaCore file: {e}")
+            logger.warning("Failed to decode TortugaCore file: %s", e)
             return None
@@ -1,5 +1,7 @@
 """Factory for creating application components."""
 
+from ..core.http_cache import HTTPCache
+from ..core.http_client import HTTPClient
 from ..scraper_refactored import AnitubeScraper
 from ..extraction.m3u8_extractor_refactored import M3U8Extractor
 from ..downloading.video_downloader_refactored import VideoDownloader
@@ -8,19 +10,29 @@ from ..cli.selector import InteractiveSelector
 from ..cli.orchestrator import DownloadOrchestrator
 
 
-def create_orchestrator(use_aria2c: bool = True) -> DownloadOrchestrator:
+def create_orchestrator(
+    use_aria2c: bool = True, use_cache: bool = True, parallel_episodes: int = 3
+) -> DownloadOrchestrator:
     """Create download orchestrator with all dependencies.
 
     Args:
         use_aria2c: Whether to use aria2c acceleration
+        use_cache: Whether to cache anime pages on disk
+        parallel_episodes: Number of episodes downloaded at once; fragment and
+            aria2c connection counts are split between these downloads
 
     Returns:
         Configured DownloadOrchestrator instance
     """
-    scraper = AnitubeScraper()
+    http_client = HTTPClient(cache=HTTPCache() if use_cache else None)
+    scraper = AnitubeScraper(http_client=http_client)
     extractor = M3U8Extractor(session=scraper.http_client.session)
     downloader = VideoDownloader(
-        download_strategy=YtDlpStrategy(use_aria2c_downloader=use_aria2c)
+        download_strategy=YtDlpStrategy(
+            use_aria2c_downloader=use_aria2c,
+            # Parallel downloads share the link; don't oversubscribe it
+            concurrent_fragments=max(4, 16 // max(1, parallel_episodes)),
+        )
     )
     selector = InteractiveSelector()
 
@@ -29,4 +41,5 @@ def create_orchestrator(use_aria2c: bool = True) -> DownloadOrchestrator:
         extractor=extractor,
         downloader=downloader,
         selector=selector,
+        parallel_episodes=parallel_episodes,
     )
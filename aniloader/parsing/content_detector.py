@@ -29,21 +29,19 @@ class ContentTypeDetector:
         Returns:
             True if movie, False if series
         """
-        unique_episode_texts = set(episode_texts)
-
-        # Method 1: Check if labeled as "ФІЛЬМ"/"FILM" (explicit movie marker)
-        has_movie_label = any(
-            "ФІЛЬМ" in text.upper() or "FILM" in text.upper()
-            for text in unique_episode_texts
-        )
-
-        # Method 2: Check if labeled as "серія"/"episode" (explicit series marker)
-        has_series_label = any(
-            "СЕРІЯ" in text.upper()
-            or "EPISODE" in text.upper()
-            or "ЕПІЗОД" in text.upper()
-            for text in unique_episode_texts
-        )
+        # Methods 1 and 2 in one pass, uppercasing each label only once:
+        # "ФІЛЬМ"/"FILM" is an explicit movie marker,
+        # "серія"/"episode" is an explicit series marker
+        has_movie_label = False
+        has_series_label = False
+        for text in set(episode_texts):
+            upper = text.upper()
+            if "ФІЛЬМ" in upper or "FILM" in upper:
+                has_movie_label = True
+            if "СЕРІЯ" in upper or "EPISODE" in upper or "ЕПІЗОД" in upper:
+                has_series_label = True
+            if has_movie_label and has_series_label:
+                break
 
         # Method 3: Count unique episodes (by data-file, not data-id)
         # If there are more unique video files than voice/player items,
@@ -1,7 +1,10 @@
 """Episode extraction logic from playlist HTML."""
 
 import logging
+from typing import Optional
+
 from ..models import Episode
+from .voice_extractor import is_player_item
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,7 @@ class EpisodeExtractor:
         player_id: str | None,
         is_movie: bool,
         all_items: list[dict[str, str | int]],
+        all_have_player_keyword: Optional[bool] = None,
     ) -> list[Episode]:
         """Extract episodes for selected voice and player.
 
@@ -25,13 +29,19 @@ class EpisodeExtractor:
             player_id: Selected player ID (optional)
             is_movie: Whether content is a movie
             all_items: All voice/player items
+            all_have_player_keyword: Whether every item in all_items is a
+                player, computed from all_items if not given
 
         Returns:
             List of Episode objects
         """
         if is_movie:
+            if all_have_player_keyword is None:
+                all_have_player_keyword = all(
+                    is_player_item(item) for item in all_items
+                )
             return self._extract_movie_episodes(
-                episode_items, voice_id, player_id, all_items
+                episode_items, voice_id, player_id, all_have_player_keyword
             )
         else:
             return self._extract_series_episodes(episode_items, voice_id, player_id)
@@ -41,7 +51,7 @@ class EpisodeExtractor:
         episode_items: list[dict[str, str]],
         voice_id: str,
         player_id: str | None,
-        all_items: list[dict[str, str | int]],
+        all_have_player_keyword: bool,
     ) -> list[Episode]:
         """Extract episodes for movie (usually just 1)."""
         episodes = []
@@ -52,12 +62,6 @@ class EpisodeExtractor:
         # 2. Complex: voice_id has players under it (0_0 -> players 0_0_0, 0_0_1)
 
         # Check if voice IS the player (simple structure)
-        all_have_player_keyword = all(
-            "ПЛЕЄР" in str(item["name"]).upper()
-            or "PLAYER" in str(item["name"]).upper()
-            for item in all_items
-        )
-
         if all_have_player_keyword:
             # Simple case: voice IS player
             for item in episode_items:
@@ -120,26 +124,24 @@ class EpisodeExtractor:
         # 1. Simple: voice_id matches episode data_id (voice IS the player)
         # 2. Complex: voice has players under it (need to find player_id)
 
-        # Check if any episode has voice_id as exact match (simple case)
-        has_direct_episodes = any(
-            item.get("data_id", "") == voice_id for item in episode_items
-        )
-
-        if has_direct_episodes and not player_id:
-            # Simple case: voice IS the player, use voice_id as player_id
-            player_id = voice_id
-        elif not player_id and voice_id:
-            # Complex case: find first available player under voice
-            voice_depth = len(voice_id.split("_"))
+        if not player_id and voice_id:
+            voice_depth = voice_id.count("_") + 1
             player_depth = voice_depth + 1
 
+            # One pass: an episode with voice_id as exact match wins (simple
+            # case), otherwise use the first available player under voice
+            first_player_id = None
             for item in episode_items:
                 data_id = item.get("data_id", "")
-                if data_id.startswith(voice_id):
-                    parts = data_id.split("_")
-                    if len(parts) >= player_depth:
-                        player_id = "_".join(parts[:player_depth])
-                        break
+                if data_id == voice_id:
+                    first_player_id = voice_id
+                    break
+                if first_player_id is None and data_id.startswith(voice_id):
+                    if data_id.count("_") + 1 >= player_depth:
+                        parts = data_id.split("_", player_depth)
+                        first_player_id = "_".join(parts[:player_depth])
+
+            player_id = first_player_id
 
         # Extract episodes only for the selected player
         for idx, item in enumerate(episode_items, 1):
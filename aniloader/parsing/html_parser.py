@@ -1,17 +1,106 @@
 """HTML parsing operations for anitube.in.ua."""
 
 import logging
-import re
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from bs4 import BeautifulSoup
+from lxml import etree
+
+from .voice_extractor import classify_item_name
 
 logger = logging.getLogger(__name__)
 
 
+def _has_class(name: str) -> str:
+    """Build XPath predicate matching elements with CSS class name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Playlist lookups run on lxml directly: no BeautifulSoup tree is built for
+# the AJAX playlist, which is parsed several times per run
+_VOICE_ITEMS_XPATH = etree.XPath(
+    f"//*[{_has_class('playlists-lists')}]//*[{_has_class('playlists-items')}]//li"
+)
+_EPISODE_ITEMS_XPATH = etree.XPath(
+    f"//*[{_has_class('playlists-videos')}]//*[{_has_class('playlists-items')}]//li"
+)
+
+
+# Comments and processing instructions are never read from the playlist, and
+# nothing looks elements up by id, so don't build them or the id table
+_PLAYLIST_PARSER = etree.HTMLParser(
+    remove_comments=True, remove_pis=True, collect_ids=False
+)
+
+
+# Full pages are parsed from UTF-8 bytes: lxml refuses a str that starts with
+# an XML encoding declaration
+_PAGE_PARSER = etree.HTMLParser(encoding="utf-8")
+
+
+# Video player iframes, matched by host inside libxml2
+_PLAYER_IFRAME_SRC_XPATH = etree.XPath(
+    "//iframe[contains(@src, 'ashdi') or contains(@src, 'tortuga')"
+    " or contains(@src, 'monster')]/@src"
+)
+
+
+def element_text(element: etree._Element) -> str:
+    """Get element text with each text node stripped, like get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+@dataclass(frozen=True)
+class PlaylistData:
+    """Everything read from one playlist HTML in a single parse.
+
+    Attributes:
+        voice_items: Voice/player items, as returned by parse_voice_items
+        episode_items: Episode items having both data_id and data_file, in
+            document order
+        episode_texts: Text labels of all episode items
+        unique_files: Unique episode data-file URLs
+        max_depth: Maximum parts_count of the voice items, 0 if none
+        all_players: Whether every voice item is a player
+    """
+
+    voice_items: list[dict[str, str | int]]
+    episode_items: list[dict[str, str]]
+    episode_texts: list[str]
+    unique_files: set[str]
+    max_depth: int
+    all_players: bool
+
+
+class ParsedPage:
+    """Page HTML whose lxml tree is built on first use and then reused."""
+
+    def __init__(self, html: str):
+        """Initialize page.
+
+        Args:
+            html: Page HTML content
+        """
+        self.html = html
+
+    @cached_property
+    def tree(self) -> etree._Element:
+        """lxml tree of the whole page, an empty html element if it has none."""
+        root = etree.HTML(self.html.encode("utf-8"), _PAGE_PARSER)
+        return root if root is not None else etree.Element("html")
+
+
 class HTMLParser:
     """Parser for HTML content from anitube.in.ua."""
 
+    def __init__(self):
+        """Initialize parser."""
+        # The scraper keeps passing the same playlist string while voices
+        # and players are selected, so remember the last parse
+        self._last_playlist: Optional[tuple[str, PlaylistData]] = None
+
     def parse_soup(self, html: str) -> BeautifulSoup:
         """Parse HTML string to BeautifulSoup object.
 
@@ -23,36 +112,95 @@ class HTMLParser:
         """
         return BeautifulSoup(html, "lxml")
 
-    def parse_voice_items(self, html: str) -> list[dict[str, str | int]]:
-        """Parse voice/player items from playlist HTML.
+    def parse_page(self, html: str) -> ParsedPage:
+        """Wrap page HTML so every consumer shares the same parse.
 
         Args:
-            html: Playlist HTML content
+            html: Page HTML content
 
         Returns:
-            List of items with id, name, and parts_count
+            ParsedPage building its trees lazily
         """
-        soup = self.parse_soup(html)
-        voice_items = soup.select(".playlists-lists .playlists-items li")
+        return ParsedPage(html)
+
+    def parse_playlist(self, html: str) -> PlaylistData:
+        """Parse voice/player and episode items from playlist HTML at once.
+
+        Args:
+            html: Playlist HTML content
 
-        all_items = []
-        for item in voice_items:
+        Returns:
+            PlaylistData with all items found in the playlist
+        """
+        cached = self._last_playlist
+        if cached is not None and cached[0] is html:
+            return cached[1]
+
+        root = etree.HTML(html, _PLAYLIST_PARSER)
+        if root is None:
+            playlist = PlaylistData([], [], [], set(), 0, True)
+            self._last_playlist = (html, playlist)
+            return playlist
+
+        voice_items = []
+        max_depth = 0
+        all_players = True
+        for item in _VOICE_ITEMS_XPATH(root):
             data_id = item.get("data-id", "")
-            name = item.get_text(strip=True)
+            name = element_text(item)
 
             if not data_id or not name:
                 continue
 
-            parts = data_id.split("_")
-            all_items.append(
+            parts_count = data_id.count("_") + 1
+            max_depth = max(max_depth, parts_count)
+            is_player, is_category = classify_item_name(name)
+            all_players = all_players and is_player
+            voice_items.append(
                 {
                     "id": data_id,
                     "name": name,
-                    "parts_count": len(parts),
+                    "parts_count": parts_count,
+                    "is_player": is_player,
+                    "is_category": is_category,
                 }
             )
 
-        return all_items
+        episode_items = []
+        episode_texts = []
+        unique_files = set()
+        for item in _EPISODE_ITEMS_XPATH(root):
+            data_id = item.get("data-id", "")
+            data_file = item.get("data-file", "")
+            episode_texts.append(element_text(item))
+
+            if data_file:
+                unique_files.add(data_file)
+                if data_id:
+                    episode_items.append({"data_id": data_id, "data_file": data_file})
+
+        playlist = PlaylistData(
+            voice_items,
+            episode_items,
+            episode_texts,
+            unique_files,
+            max_depth,
+            all_players,
+        )
+        self._last_playlist = (html, playlist)
+        return playlist
+
+    def parse_voice_items(self, html: str) -> list[dict[str, str | int]]:
+        """Parse voice/player items from playlist HTML.
+
+        Args:
+            html: Playlist HTML content
+
+        Returns:
+            List of items with id, name, parts_count, and the is_player /
+            is_category keyword flags
+        """
+        return self.parse_playlist(html).voice_items
 
     def parse_episode_items(
         self, html: str, player_id: str
@@ -66,18 +214,11 @@ class HTMLParser:
         Returns:
             List of episode dictionaries with number, id, and file URL
         """
-        soup = self.parse_soup(html)
-        episode_items = soup.select(".playlists-videos .playlists-items li")
-
         episodes = []
         episode_number = 1
 
-        for item in episode_items:
-            data_id = item.get("data-id", "")
-            data_file = item.get("data-file", "")
-
-            if not data_id or not data_file:
-                continue
+        for item in self.parse_playlist(html).episode_items:
+            data_id = item["data_id"]
 
             # Filter by player_id
             if not data_id.startswith(player_id):
@@ -87,7 +228,7 @@ class HTMLParser:
                 {
                     "number": episode_number,
                     "data_id": data_id,
-                    "data_file": data_file,
+                    "data_file": item["data_file"],
                 }
             )
             episode_number += 1
@@ -103,9 +244,7 @@ class HTMLParser:
         Returns:
             List of episode text labels
         """
-        soup = self.parse_soup(html)
-        episode_items = soup.select(".playlists-videos .playlists-items li")
-        return [item.get_text(strip=True) for item in episode_items]
+        return self.parse_playlist(html).episode_texts
 
     def get_unique_episode_files(self, html: str) -> set[str]:
         """Extract unique episode data-file URLs.
@@ -116,16 +255,7 @@ class HTMLParser:
         Returns:
             Set of unique data-file URLs
         """
-        soup = self.parse_soup(html)
-        episode_items = soup.select(".playlists-videos .playlists-items li")
-
-        unique_files = set()
-        for item in episode_items:
-            data_file = item.get("data-file", "")
-            if data_file:
-                unique_files.add(data_file)
-
-        return unique_files
+        return self.parse_playlist(html).unique_files
 
     def get_max_depth(self, items: list[dict[str, str | int]]) -> int:
         """Get maximum depth from list of items.
@@ -150,43 +280,37 @@ class HTMLParser:
         Returns:
             List of child items
         """
-        parent_parts = parent_id.split("_")
-        parent_depth = len(parent_parts)
+        parent_depth = parent_id.count("_") + 1
         target_depth = parent_depth + 1
+        child_prefix = parent_id + "_"
 
         filtered = []
         for item in items:
-            item_id = str(item["id"])
-            if (
-                item_id.startswith(parent_id + "_")
-                and item["parts_count"] == target_depth
-            ):
+            if item["parts_count"] != target_depth:
+                continue
+            if str(item["id"]).startswith(child_prefix):
                 filtered.append(item)
 
         return filtered
 
-    def find_embedded_iframe(self, html: str) -> Optional[str]:
+    def find_embedded_iframe(self, html: str | ParsedPage) -> Optional[str]:
         """Find embedded video player iframe URL in HTML.
 
         Args:
-            html: Page HTML content
+            html: Page HTML content, or an already parsed page
 
         Returns:
             Iframe URL if found, None otherwise
         """
-        soup = self.parse_soup(html)
+        page = html if isinstance(html, ParsedPage) else self.parse_page(html)
 
         # Find iframe with video player
-        iframe = soup.find("iframe", src=re.compile(r"(ashdi|tortuga|monster)"))
-
-        if not iframe:
+        iframe_srcs = _PLAYER_IFRAME_SRC_XPATH(page.tree)
+        if not iframe_srcs:
             logger.debug("No embedded iframe found in HTML")
             return None
 
-        iframe_url = iframe.get("src", "")
-        if not iframe_url:
-            logger.debug("Iframe found but has no src attribute")
-            return None
+        iframe_url = str(iframe_srcs[0])
 
         # Normalize URL (add protocol if missing)
         if not iframe_url.startswith("http"):
@@ -4,10 +4,54 @@ import re
 import logging
 import urllib.parse
 from typing import Optional
-from bs4 import BeautifulSoup
+
+from lxml import etree
+
+from .html_parser import element_text
 
 logger = logging.getLogger(__name__)
 
+_NEWS_ID_RE = re.compile(r"/(\d+)-.*\.html")
+_DLE_HASH_RE = re.compile(r'dle_login_hash\s*=\s*["\']([^"\']+)["\']')
+_USER_HASH_RE = re.compile(r'user_hash["\']?\s*:\s*["\']([^"\']+)["\']')
+
+_TWITTER_SHARE_HREF_XPATH = etree.XPath(
+    "//a[contains(@href, 'twitter.com/intent/tweet')]/@href"
+)
+_SHARE_TEXT_RE = re.compile(r"text=([^&]+)")
+_TRAILING_URL_RE = re.compile(r"\s*https?://.*$")
+
+# Patterns: "Name 3", "Name Season 4", "Name S2"
+_SEASON_RES = [
+    re.compile(r"\bSeason\s+(\d+)\b", re.IGNORECASE),
+    re.compile(r"\bS(\d+)\b", re.IGNORECASE),
+    re.compile(r"\s+(\d+)$"),  # Number at end of title
+]
+
+# Season suffixes removed from the end of the title
+_SEASON_SUFFIX_RES = [
+    re.compile(r"\s+Season\s+\d+$", re.IGNORECASE),
+    re.compile(r"\s+S\d+$", re.IGNORECASE),
+    re.compile(r"\s+\d+$"),
+]
+
+# Title fallbacks in order of preference: og:title, h1.title, any h1
+_OG_TITLE_XPATH = etree.XPath("//meta[@property='og:title']")
+_H1_TITLE_XPATH = etree.XPath(
+    "//h1[contains(concat(' ', normalize-space(@class), ' '), ' title ')]"
+)
+_H1_XPATH = etree.XPath("//h1")
+
+_RELEASE_DATE_XPATH = etree.XPath("//meta[@property='video:release_date']/@content")
+# Same text nodes as BeautifulSoup's get_text(): no script/style/template
+# content, and comments aren't text nodes
+_PAGE_TEXT_XPATH = etree.XPath(
+    "//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+_FOUR_DIGITS_RE = re.compile(r"(\d{4})")
+_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+
 
 class MetadataExtractor:
     """Extractor for anime metadata from HTML pages."""
@@ -24,7 +68,7 @@ class MetadataExtractor:
         Raises:
             ValueError: If news_id cannot be extracted
         """
-        match = re.search(r"/(\d+)-.*\.html", url)
+        match = _NEWS_ID_RE.search(url)
         if not match:
             raise ValueError(f"Could not extract news_id from URL: {url}")
         return match.group(1)
@@ -39,34 +83,34 @@ class MetadataExtractor:
             User hash string (empty if not found)
         """
         # Try to find user_hash in script tags
-        match = re.search(r'dle_login_hash\s*=\s*["\']([^"\']+)["\']', html)
+        match = _DLE_HASH_RE.search(html)
         if match:
             return match.group(1)
 
         # Fallback: look for common hash patterns
-        match = re.search(r'user_hash["\']?\s*:\s*["\']([^"\']+)["\']', html)
+        match = _USER_HASH_RE.search(html)
         if match:
             return match.group(1)
 
         # If not found, return empty string (some requests work without it)
         return ""
 
-    def extract_title(self, soup: BeautifulSoup) -> str:
+    def extract_title(self, root: etree._Element) -> str:
         """Extract English title from page.
 
         Args:
-            soup: BeautifulSoup object of the page
+            root: lxml tree of the page
 
         Returns:
             English title (or "Unknown" if not found)
         """
         # Extract English title from Twitter share link
         # Format: "Українська назва / English Name https://..."
-        twitter_link = soup.find("a", href=re.compile(r"twitter\.com/intent/tweet"))
-        if twitter_link:
-            href = str(twitter_link.get("href", ""))
+        twitter_hrefs = _TWITTER_SHARE_HREF_XPATH(root)
+        if twitter_hrefs:
+            href = str(twitter_hrefs[0])
             # Extract text parameter from URL
-            match = re.search(r"text=([^&]+)", href)
+            match = _SHARE_TEXT_RE.search(href)
             if match:
                 decoded_text = urllib.parse.unquote(match.group(1))
                 # Split by " / " and take English part
@@ -74,25 +118,21 @@ class MetadataExtractor:
                     parts = decoded_text.split(" / ")
                     if len(parts) >= 2:
                         # Remove URL at the end (everything after http)
-                        english_part = re.sub(r"\s*https?://.*$", "", parts[1])
+                        english_part = _TRAILING_URL_RE.sub("", parts[1])
                         title_en = english_part.strip()
                         if title_en:
                             return title_en
 
         # Fallback to og:title if English name not found
-        title_tag = (
-            soup.find("meta", property="og:title")
-            or soup.find("h1", class_="title")
-            or soup.find("h1")
-        )
-
-        if title_tag:
-            # Meta tags have content attribute, h1 tags need get_text
-            if title_tag.name == "meta":
-                content = title_tag.get("content")
-                title_text = str(content) if content else ""
+        title_tags = _OG_TITLE_XPATH(root) or _H1_TITLE_XPATH(root) or _H1_XPATH(root)
+
+        if title_tags:
+            title_tag = title_tags[0]
+            # Meta tags have content attribute, h1 tags need their text
+            if title_tag.tag == "meta":
+                title_text = title_tag.get("content", "")
             else:
-                title_text = title_tag.get_text(strip=True)
+                title_text = element_text(title_tag)
 
             if title_text:
                 return str(title_text)
@@ -108,15 +148,8 @@ class MetadataExtractor:
         Returns:
             Season number (defaults to 1 if not found)
         """
-        # Patterns: "Name 3", "Name Season 4", "Name S2"
-        patterns = [
-            r"\bSeason\s+(\d+)\b",
-            r"\bS(\d+)\b",
-            r"\s+(\d+)$",  # Number at end of title
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
+        for pattern in _SEASON_RES:
+            match = pattern.search(title)
             if match:
                 season_num = int(match.group(1))
                 if season_num > 0:
@@ -126,32 +159,28 @@ class MetadataExtractor:
         logger.debug(f"No season found in title, defaulting to 1: {title}")
         return 1
 
-    def extract_year(self, soup: BeautifulSoup) -> Optional[int]:
+    def extract_year(self, root: etree._Element) -> Optional[int]:
         """Extract release year from page.
 
         Args:
-            soup: BeautifulSoup object of the page
+            root: lxml tree of the page
 
         Returns:
             Release year or None if not found
         """
         # Look for year in various possible locations
         # 1. In meta tags
-        year_meta = soup.find("meta", property="video:release_date")
-        if year_meta and hasattr(year_meta, "get"):
-            content = year_meta.get("content")
-            if content:
-                year_str = str(content)
-                match = re.search(r"(\d{4})", year_str)
-                if match:
-                    return int(match.group(1))
-
-        # 2. In page content (look for 4-digit year)
-        content = soup.get_text()
-        year_matches = re.findall(r"\b(20\d{2})\b", content)
-        if year_matches:
-            # Take the most common year or the first one
-            return int(year_matches[0])
+        release_dates = _RELEASE_DATE_XPATH(root)
+        if release_dates:
+            match = _FOUR_DIGITS_RE.search(str(release_dates[0]))
+            if match:
+                return int(match.group(1))
+
+        # 2. In page content (look for 4-digit year), first text node wins
+        for text in _PAGE_TEXT_XPATH(root):
+            match = _YEAR_RE.search(text)
+            if match:
+                return int(match.group(1))
 
         return None
 
@@ -165,14 +194,8 @@ class MetadataExtractor:
             Base title without season number
         """
         # Remove patterns like " 3", " Season 4", " S2" from end
-        patterns = [
-            r"\s+Season\s+\d+$",
-            r"\s+S\d+$",
-            r"\s+\d+$",
-        ]
-
         base_title = title
-        for pattern in patterns:
-            base_title = re.sub(pattern, "", base_title, flags=re.IGNORECASE)
+        for pattern in _SEASON_SUFFIX_RES:
+            base_title = pattern.sub("", base_title)
 
         return base_title.strip()
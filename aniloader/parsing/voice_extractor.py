@@ -1,16 +1,16 @@
 """Voice and player extraction logic."""
 
 import logging
+import re
+from typing import Optional
+
 from ..models import Voice, Player
 
 logger = logging.getLogger(__name__)
 
-
-class VoiceExtractor:
-    """Extractor for voice options from playlist items."""
-
-    # Category keywords to skip (these are usually parent containers)
-    CATEGORY_KEYWORDS = [
+# Category keywords to skip (these are usually parent containers)
+CATEGORY_KEYWORDS = frozenset(
+    {
         "ОЗВУЧЕННЯ",
         "СУБТИТРИ",
         "DUBBING",
@@ -18,13 +18,56 @@ class VoiceExtractor:
         "УКРАЇНСЬКОЮ",
         "RUSSIAN",
         "ENGLISH",
-    ]
+    }
+)
+
+_PLAYER_KEYWORD_RE = re.compile("ПЛЕЄР|PLAYER")
+_CATEGORY_KEYWORD_RE = re.compile("|".join(sorted(CATEGORY_KEYWORDS)))
+
+
+def classify_item_name(name: str) -> tuple[bool, bool]:
+    """Classify playlist item name by its keywords.
+
+    Args:
+        name: Item name as shown in the playlist
+
+    Returns:
+        Tuple of (is_player, is_category)
+    """
+    name_upper = name.upper()
+    return (
+        _PLAYER_KEYWORD_RE.search(name_upper) is not None,
+        _CATEGORY_KEYWORD_RE.search(name_upper) is not None,
+    )
+
+
+def is_player_item(item: dict[str, str | int]) -> bool:
+    """Check if item is a player, using the flag set by HTMLParser if present."""
+    flag = item.get("is_player")
+    if flag is None:
+        flag = classify_item_name(str(item["name"]))[0]
+    return bool(flag)
+
+
+def is_category_item(item: dict[str, str | int]) -> bool:
+    """Check if item is a category, using the flag set by HTMLParser if present."""
+    flag = item.get("is_category")
+    if flag is None:
+        flag = classify_item_name(str(item["name"]))[1]
+    return bool(flag)
+
+
+class VoiceExtractor:
+    """Extractor for voice options from playlist items."""
+
+    CATEGORY_KEYWORDS = CATEGORY_KEYWORDS
 
     def extract_voices(
         self,
         all_items: list[dict[str, str | int]],
         is_movie: bool,
         max_depth: int,
+        all_have_player_keyword: Optional[bool] = None,
     ) -> list[Voice]:
         """Extract voice options from playlist items.
 
@@ -32,16 +75,25 @@ class VoiceExtractor:
             all_items: All voice/player items from playlist
             is_movie: Whether content is a movie
             max_depth: Maximum depth of items
+            all_have_player_keyword: Whether every item is a player, computed
+                from all_items if not given
 
         Returns:
             List of Voice objects
         """
         voices = []
 
+        if all_have_player_keyword is None:
+            all_have_player_keyword = all(is_player_item(item) for item in all_items)
+
         if is_movie:
-            voices = self._extract_voices_for_movie(all_items, max_depth)
+            voices = self._extract_voices_for_movie(
+                all_items, max_depth, all_have_player_keyword
+            )
         else:
-            voices = self._extract_voices_for_series(all_items, max_depth)
+            voices = self._extract_voices_for_series(
+                all_items, max_depth, all_have_player_keyword
+            )
 
         logger.debug(f"Extracted {len(voices)} voices")
         return voices
@@ -50,6 +102,7 @@ class VoiceExtractor:
         self,
         all_items: list[dict[str, str | int]],
         max_depth: int,
+        all_have_player_keyword: bool,
     ) -> list[Voice]:
         """Extract voices for movie content."""
         voices = []
@@ -57,11 +110,6 @@ class VoiceExtractor:
         # Check structure:
         # - If all items have "ПЛЕЄР" in name → use all items as players (simple structure)
         # - Otherwise → find voices (items without "ПЛЕЄР" at lower depth)
-        all_have_player_keyword = all(
-            "ПЛЕЄР" in str(item["name"]).upper()
-            or "PLAYER" in str(item["name"]).upper()
-            for item in all_items
-        )
 
         if all_have_player_keyword:
             # Simple structure: players at top level (0_0, 0_1)
@@ -71,11 +119,7 @@ class VoiceExtractor:
             # Complex structure: voices -> players (0_0 -> 0_0_0)
             # Only include items that are NOT players (no ПЛЕЄР keyword)
             for item in all_items:
-                is_player = (
-                    "ПЛЕЄР" in str(item["name"]).upper()
-                    or "PLAYER" in str(item["name"]).upper()
-                )
-                if not is_player and item["parts_count"] < max_depth:
+                if not is_player_item(item) and item["parts_count"] < max_depth:
                     voices.append(Voice(id=str(item["id"]), name=str(item["name"])))
 
         return voices
@@ -84,6 +128,7 @@ class VoiceExtractor:
         self,
         all_items: list[dict[str, str | int]],
         max_depth: int,
+        all_have_player_keyword: bool,
     ) -> list[Voice]:
         """Extract voices for series content."""
         voices = []
@@ -93,11 +138,6 @@ class VoiceExtractor:
         # 2. Don't have "ПЛЕЄР" in name (those are players)
         # 3. Are not category containers
         # Special case: If ALL items are players, then players ARE voices (simple structure)
-        all_have_player_keyword = all(
-            "ПЛЕЄР" in str(item["name"]).upper()
-            or "PLAYER" in str(item["name"]).upper()
-            for item in all_items
-        )
 
         if all_have_player_keyword:
             # Simple structure: all items are players = voices for series
@@ -106,18 +146,14 @@ class VoiceExtractor:
         else:
             # Complex structure: find voices (items without "ПЛЕЄР")
             for item in all_items:
-                is_player = (
-                    "ПЛЕЄР" in str(item["name"]).upper()
-                    or "PLAYER" in str(item["name"]).upper()
-                )
                 is_max_depth = item["parts_count"] == max_depth
-                is_category = any(
-                    keyword in str(item["name"]).upper()
-                    for keyword in self.CATEGORY_KEYWORDS
-                )
 
                 # Skip players, max depth items, and categories
-                if is_player or (is_max_depth and max_depth > 2) or is_category:
+                if (
+                    is_player_item(item)
+                    or (is_max_depth and max_depth > 2)
+                    or is_category_item(item)
+                ):
                     continue
 
                 voices.append(Voice(id=str(item["id"]), name=str(item["name"])))
@@ -139,16 +175,16 @@ class VoiceExtractor:
             List of Player objects
         """
         players = []
-        voice_depth = len(voice_id.split("_"))
+        voice_depth = voice_id.count("_") + 1
         player_depth = voice_depth + 1
+        child_prefix = voice_id + "_"
 
         for item in all_items:
-            item_id = str(item["id"])
             # Check if this item is a child of voice_id
-            if (
-                item_id.startswith(voice_id + "_")
-                and item["parts_count"] == player_depth
-            ):
+            if item["parts_count"] != player_depth:
+                continue
+            item_id = str(item["id"])
+            if item_id.startswith(child_prefix):
                 players.append(Player(id=item_id, name=str(item["name"])))
 
         logger.debug(f"Found {len(players)} players for voice {voice_id}")
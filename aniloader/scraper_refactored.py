@@ -6,7 +6,7 @@ from typing import Optional
 
 from .models import Anime, Episode, Player, Voice
 from .core.http_client import HTTPClient
-from .parsing.html_parser import HTMLParser
+from .parsing.html_parser import HTMLParser, ParsedPage
 from .parsing.metadata_extractor import MetadataExtractor
 from .parsing.content_detector import ContentTypeDetector
 from .parsing.voice_extractor import VoiceExtractor
@@ -47,8 +47,10 @@ class AnitubeScraper:
 
         # Internal state
         self._anime_url: Optional[str] = None
+        self._anime_page: Optional[ParsedPage] = None
         self._playlist_html: str = ""
         self._user_hash: str = ""
+        self._page_from_cache: bool = False
         self._all_items: list[dict[str, str | int]] = []
 
     @property
@@ -66,15 +68,17 @@ class AnitubeScraper:
             Anime object with basic metadata
         """
         self._anime_url = url
-        response = self.http_client.get(url)
-        soup = self.html_parser.parse_soup(response.text)
+        self._playlist_html = ""
+        html, self._page_from_cache = self.http_client.fetch_text(url)
+        self._anime_page = self.html_parser.parse_page(html)
+        root = self._anime_page.tree
 
         # Extract metadata
         news_id = self.metadata_extractor.extract_news_id(url)
-        title_en = self.metadata_extractor.extract_title(soup)
+        title_en = self.metadata_extractor.extract_title(root)
         season = self.metadata_extractor.extract_season(title_en)
-        year = self.metadata_extractor.extract_year(soup)
-        self._user_hash = self.metadata_extractor.extract_user_hash(response.text)
+        year = self.metadata_extractor.extract_year(root)
+        self._user_hash = self.metadata_extractor.extract_user_hash(html)
 
         # Get base title without season number
         base_title = self.metadata_extractor.get_base_title(title_en)
@@ -110,57 +114,61 @@ class AnitubeScraper:
         if not self._anime_url:
             raise ValueError("anime_url not set. Call fetch_anime_metadata first.")
 
-        # Make AJAX request
-        try:
-            html_content = self.http_client.ajax_playlist_request(
-                news_id=anime.news_id,
-                user_hash=self._user_hash,
-                referer=self._anime_url,
-            )
-
-            # Try to parse as JSON (new format)
+        # Voice/player selection calls this again for the same anime, and the
+        # playlist holds all voices and players, so reuse the earlier response
+        if self._playlist_html:
+            html_content = self._playlist_html
+        else:
+            # Make AJAX request
             try:
-                data = json.loads(html_content)
-                html_content = data.get("response", "")
-
-                if not data.get("success", True) or not html_content:
-                    logger.info("AJAX playlist not available, using fallback")
-                    return self._parse_embedded_iframe(anime)
-            except json.JSONDecodeError:
-                # Response is plain HTML
-                pass
-
-        except Exception as e:
-            logger.error(f"Failed to fetch playlist: {e}")
-            return anime
-
-        self._playlist_html = html_content
-
-        # Parse voice/player items
-        self._all_items = self.html_parser.parse_voice_items(html_content)
+                html_content = self.http_client.ajax_playlist_request(
+                    news_id=anime.news_id,
+                    user_hash=self._user_hash,
+                    referer=self._anime_url,
+                )
+
+                # Try to parse as JSON (new format)
+                try:
+                    data = json.loads(html_content)
+                    html_content = data.get("response", "")
+
+                    if not data.get("success", True) or not html_content:
+                        if self._refresh_cached_page():
+                            return self.fetch_playlist(anime, voice_id, player_id)
+                        logger.info("AJAX playlist not available, using fallback")
+                        return self._parse_embedded_iframe(anime)
+                except json.JSONDecodeError:
+                    # Response is plain HTML
+                    pass
+
+            except Exception as e:
+                logger.error(f"Failed to fetch playlist: {e}")
+                return anime
+
+            self._playlist_html = html_content
+
+        # Parse voice/player and episode items in one pass
+        playlist = self.html_parser.parse_playlist(html_content)
+        self._all_items = playlist.voice_items
 
         if not self._all_items:
             logger.warning("No voice/player items found")
             return anime
 
-        # Get episode information for content type detection
-        episode_texts = self.html_parser.get_episode_texts(html_content)
-        unique_files = self.html_parser.get_unique_episode_files(html_content)
-
         # Detect content type
         is_movie = self.content_detector.detect_is_movie(
-            episode_texts=episode_texts,
-            unique_files_count=len(unique_files),
+            episode_texts=playlist.episode_texts,
+            unique_files_count=len(playlist.unique_files),
             total_items_count=len(self._all_items),
         )
         anime.is_movie = is_movie
 
         # Extract voices
-        max_depth = self.html_parser.get_max_depth(self._all_items)
         voices = self.voice_extractor.extract_voices(
             all_items=self._all_items,
             is_movie=is_movie,
-            max_depth=max_depth,
+            max_depth=playlist.max_depth,
+            all_have_player_keyword=playlist.all_players,
         )
         anime.voices = voices
 
@@ -183,6 +191,7 @@ class AnitubeScraper:
             player_id=player_id,
             is_movie=is_movie,
             all_items=self._all_items,
+            all_have_player_keyword=playlist.all_players,
         )
         anime.episodes = episodes
 
@@ -216,6 +225,27 @@ class AnitubeScraper:
 
         return players
 
+    def _refresh_cached_page(self) -> bool:
+        """Refetch the anime page if it was served from cache.
+
+        The user hash in a cached page may no longer be accepted, and reading
+        it from disk set no site cookies, so a rejected playlist request is
+        retried with a fresh page before falling back to the embedded iframe.
+
+        Returns:
+            True if the page was refetched and the playlist should be retried
+        """
+        if not self._page_from_cache or not self._anime_url:
+            return False
+
+        logger.info("Playlist rejected for cached page, refetching the page")
+        html, self._page_from_cache = self.http_client.fetch_text(
+            self._anime_url, use_cache=False
+        )
+        self._anime_page = self.html_parser.parse_page(html)
+        self._user_hash = self.metadata_extractor.extract_user_hash(html)
+        return True
+
     def _parse_embedded_iframe(self, anime: Anime) -> Anime:
         """Fallback parser for old format pages with embedded iframe.
 
@@ -234,11 +264,15 @@ class AnitubeScraper:
             anime.episodes = []
             return anime
 
-        # Fetch the original page HTML
-        response = self.http_client.get(self._anime_url)
+        # Reuse the page parsed for metadata, fetch it only if that is missing
+        page = self._anime_page
+        if page is None:
+            page = self.html_parser.parse_page(
+                self.http_client.get_text(self._anime_url)
+            )
 
         # Find embedded iframe using HTMLParser
-        iframe_url = self.html_parser.find_embedded_iframe(response.text)
+        iframe_url = self.html_parser.find_embedded_iframe(page)
 
         if not iframe_url:
             logger.error("No embedded iframe found on page")
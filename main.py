@@ -9,6 +9,7 @@ from aniloader.exceptions import (
     AniloaderError,
     NoVoicesError,
     NoPlayersError,
+    NoTerminalError,
     UserCancelledError,
 )
 
@@ -66,6 +67,20 @@ def parse_arguments() -> argparse.Namespace:
         help="Disable aria2c acceleration (use only yt-dlp)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always refetch anime pages instead of using the on-disk cache",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=3,
+        help="Number of episodes to download in parallel (default: 3)",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -87,7 +102,11 @@ def main() -> int:
 
     try:
         # Create orchestrator
-        orchestrator = create_orchestrator(use_aria2c=not args.no_aria2c)
+        orchestrator = create_orchestrator(
+            use_aria2c=not args.no_aria2c,
+            use_cache=not args.no_cache,
+            parallel_episodes=args.jobs,
+        )
 
         # Run download process
         stats = orchestrator.run(
@@ -98,7 +117,8 @@ def main() -> int:
         )
 
         # Return exit code based on results
-        if stats["failed"] > 0 and stats["successful"] == 0:
+        completed = stats["successful"] + stats.get("skipped", 0)
+        if stats["failed"] > 0 and completed == 0:
             return 1  # All failed
         return 0  # At least some succeeded
 
@@ -110,7 +130,7 @@ def main() -> int:
         print("\n\nCancelled by user")
         return 0
 
-    except (NoVoicesError, NoPlayersError) as e:
+    except (NoVoicesError, NoPlayersError, NoTerminalError) as e:
         print(f"\nError: {e}")
         return 1
 
@@ -1,8 +1,13 @@
 """Tests for downloader modules."""
 
+import io
+from pathlib import Path
+
 import pytest
 
 from aniloader.downloading.filesystem import sanitize_filename, FileSystemManager
+from aniloader.downloading.strategies import ytdlp_strategy
+from aniloader.downloading.strategies.ytdlp_strategy import YtDlpStrategy
 from aniloader.downloading.video_downloader_refactored import VideoDownloader
 from aniloader.models import Anime, Episode
 
@@ -55,6 +60,12 @@ class TestSanitizeFilename:
         """Test that multiple spaces are collapsed to single space."""
         assert sanitize_filename("Multiple   spaces   here") == "Multiple spaces here"
 
+    def test_other_whitespace_normalized(self):
+        """Test that tabs, newlines and non-breaking spaces become spaces."""
+        assert sanitize_filename("Test\tName") == "Test Name"
+        assert sanitize_filename("Test\nName") == "Test Name"
+        assert sanitize_filename("Test\xa0Name") == "Test Name"
+
     def test_complex_filename(self):
         """Test complex filename with multiple problematic characters."""
         input_name = "Avatar: The Last Airbender / Book 1: Water (2025)"
@@ -127,6 +138,14 @@ class TestFilenameGeneration:
         assert filename == "Avatar - The Last Airbender S01E01.mp4"
         assert ":" not in filename
 
+    def test_generate_filename_series_title_edge_cases(self, fs_manager):
+        """Test that sanitizing only the prefix matches sanitizing the whole name."""
+        episode = Episode(number=3, data_id="0_0", data_file="test.m3u8")
+        for title in ["Dr. Stone", "...", "  Spaced   Title ", "What?"]:
+            anime = Anime(news_id="1", title_en=title, season=2, is_movie=False)
+            expected = sanitize_filename(f"{title} S02E03.mp4")
+            assert fs_manager.generate_episode_filename(anime, episode) == expected
+
 
 class TestFileSystemManager:
     """Test FileSystemManager class."""
@@ -154,6 +173,16 @@ class TestFileSystemManager:
         assert output_dir.exists()
         assert output_dir.is_dir()
 
+    def test_create_output_directory_reused(
+        self, fs_manager, anime_series, tmp_path, monkeypatch
+    ):
+        """Test that a directory is only created once per manager."""
+        first = fs_manager.create_output_directory(anime_series, str(tmp_path))
+        monkeypatch.setattr(
+            Path, "mkdir", lambda *args, **kwargs: pytest.fail("mkdir called")
+        )
+        assert fs_manager.create_output_directory(anime_series, str(tmp_path)) == first
+
     def test_create_output_directory_with_invalid_chars(self, fs_manager, tmp_path):
         """Test that invalid characters are sanitized in directory names."""
         anime = Anime(
@@ -183,6 +212,13 @@ class TestFileSystemManager:
         """Test file_exists returns False for directory."""
         assert fs_manager.file_exists(tmp_path) is False
 
+    def test_list_files(self, fs_manager, tmp_path):
+        """Test that only file names are listed."""
+        (tmp_path / "a.mp4").touch()
+        (tmp_path / "sub").mkdir()
+        assert fs_manager.list_files(tmp_path) == {"a.mp4"}
+        assert fs_manager.list_files(tmp_path / "missing") == set()
+
 
 class TestVideoDownloader:
     """Test VideoDownloader class."""
@@ -206,6 +242,34 @@ class TestVideoDownloader:
         assert success is False
         assert "no m3u8_url" in message
 
+    def test_is_downloaded(self, downloader, anime_series, episode, tmp_path):
+        """Test is_downloaded reflects whether the episode file exists."""
+        assert downloader.is_downloaded(anime_series, episode, tmp_path) is False
+
+        (tmp_path / "Test Anime S01E01.mp4").write_text("existing")
+        assert downloader.is_downloaded(anime_series, episode, tmp_path) is True
+
+    def test_is_downloaded_uses_snapshot(
+        self, downloader, anime_series, episode, tmp_path
+    ):
+        """Test is_downloaded checks the given listing instead of the filesystem."""
+        filename = downloader.fs_manager.generate_episode_filename(
+            anime_series, episode
+        )
+        existing = downloader.list_existing_files(tmp_path)
+        assert (
+            downloader.is_downloaded(anime_series, episode, tmp_path, existing) is False
+        )
+
+        (tmp_path / filename).touch()
+        assert (
+            downloader.is_downloaded(anime_series, episode, tmp_path, existing) is False
+        )
+        existing = downloader.list_existing_files(tmp_path)
+        assert (
+            downloader.is_downloaded(anime_series, episode, tmp_path, existing) is True
+        )
+
     def test_download_episode_skips_existing(self, downloader, anime_series, tmp_path):
         """Test download_episode skips already existing files."""
         episode = Episode(
@@ -226,3 +290,102 @@ class TestVideoDownloader:
         )
         assert success is True
         assert "already exists" in message
+
+    def test_download_episode_existing_without_m3u8_url(
+        self, downloader, anime_series, episode, tmp_path
+    ):
+        """Test that an existing file is skipped even without an m3u8 URL."""
+        filename = downloader.fs_manager.generate_episode_filename(
+            anime_series, episode
+        )
+        (tmp_path / filename).touch()
+
+        success, message = downloader.download_episode(anime_series, episode, tmp_path)
+        assert success is True
+        assert "already exists" in message
+
+
+class TestYtDlpStrategy:
+    """Test YtDlpStrategy class."""
+
+    @pytest.fixture
+    def which_calls(self, monkeypatch):
+        """Fake yt-dlp and aria2c on $PATH and record lookups."""
+        calls = []
+
+        def fake_which(name):
+            calls.append(name)
+            return f"/usr/bin/{name}"
+
+        monkeypatch.setattr(ytdlp_strategy.shutil, "which", fake_which)
+        ytdlp_strategy._which.cache_clear()
+        yield calls
+        ytdlp_strategy._which.cache_clear()
+
+    @pytest.fixture
+    def fake_popen(self, monkeypatch):
+        """Replace subprocess.Popen and record commands."""
+
+        class FakePopen:
+            calls: list[list[str]] = []
+            returncode = 0
+            stderr_text = ""
+
+            def __init__(self, cmd, **kwargs):
+                self.calls.append(cmd)
+                self.stderr = io.BytesIO(self.stderr_text.encode("utf-8"))
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def wait(self):
+                return self.returncode
+
+        monkeypatch.setattr(ytdlp_strategy.subprocess, "Popen", FakePopen)
+        return FakePopen
+
+    def test_download_uses_resolved_binary(self, which_calls, fake_popen, tmp_path):
+        """Test that binaries are resolved once, not per download or instance."""
+        strategy = YtDlpStrategy(use_aria2c_downloader=True)
+        YtDlpStrategy(use_aria2c_downloader=True)
+
+        assert strategy.download("https://example.com/a.m3u8", tmp_path / "a.mp4")
+        assert strategy.download("https://example.com/b.m3u8", tmp_path / "b.mp4")
+
+        assert sorted(which_calls) == ["aria2c", "yt-dlp"]
+        assert fake_popen.calls[0][0] == "/usr/bin/yt-dlp"
+        assert "aria2c" in fake_popen.calls[0]
+        assert fake_popen.calls[1][-1] == "https://example.com/b.m3u8"
+        assert fake_popen.calls[1][-2] == str(tmp_path / "b.mp4")
+
+    def test_download_without_aria2c(self, which_calls, fake_popen, tmp_path):
+        """Test that aria2c args are omitted when disabled."""
+        strategy = YtDlpStrategy(use_aria2c_downloader=False)
+
+        assert strategy.download("https://example.com/a.m3u8", tmp_path / "a.mp4")
+        assert "--downloader" not in fake_popen.calls[0]
+
+    def test_concurrent_fragments(self, which_calls, fake_popen, tmp_path):
+        """Test that fragment concurrency is passed to yt-dlp."""
+        strategy = YtDlpStrategy(concurrent_fragments=5)
+
+        assert strategy.download("https://example.com/a.m3u8", tmp_path / "a.mp4")
+        cmd = fake_popen.calls[0]
+        assert cmd[cmd.index("--concurrent-fragments") + 1] == "5"
+        aria2c_args = cmd[cmd.index("--downloader-args") + 1]
+        assert "--max-connection-per-server=5" in aria2c_args
+        assert "--split=5" in aria2c_args
+
+    def test_download_failure_reports_stderr(
+        self, which_calls, fake_popen, tmp_path, caplog
+    ):
+        """Test that a non-zero exit code is reported with stderr tail."""
+        fake_popen.returncode = 1
+        fake_popen.stderr_text = "ERROR: Unable to download\n"
+        strategy = YtDlpStrategy()
+
+        assert not strategy.download("https://example.com/a.m3u8", tmp_path / "a.mp4")
+        assert "ERROR: Unable to download" in caplog.text
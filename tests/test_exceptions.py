@@ -7,6 +7,7 @@ from aniloader.exceptions import (
     NoVoicesError,
     NoPlayersError,
     UserCancelledError,
+    NoTerminalError,
     ExtractionError,
     DownloadError,
 )
@@ -20,6 +21,7 @@ class TestExceptions:
         assert issubclass(NoVoicesError, AniloaderError)
         assert issubclass(NoPlayersError, AniloaderError)
         assert issubclass(UserCancelledError, AniloaderError)
+        assert issubclass(NoTerminalError, AniloaderError)
         assert issubclass(ExtractionError, AniloaderError)
         assert issubclass(DownloadError, AniloaderError)
 
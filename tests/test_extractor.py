@@ -1,6 +1,7 @@
 """Tests for extractor modules."""
 
 import base64
+import time
 
 import pytest
 import responses
@@ -72,6 +73,12 @@ class TestTortugaCoreExtractor:
         result = extractor.extract_url(html)
         assert result == "https://example.com/video.m3u8"
 
+    def test_extract_url_non_ascii_payload(self, extractor):
+        """Test that a non-ASCII decoded payload is rejected."""
+        encoded = base64.b64encode("https://приклад.укр/v.m3u8".encode()).decode()
+        html = f'<script>new TortugaCore({{file: "{encoded}"}})</script>'
+        assert extractor.extract_url(html) is None
+
 
 class TestPlayerJSExtractor:
     """Test PlayerJSExtractor class."""
@@ -133,6 +140,21 @@ class TestPlayerJSExtractor:
         result = extractor.extract_url(html)
         assert result == "https://cdn.example.com/video.m3u8"
 
+    def test_extract_url_nested_config(self, extractor):
+        """Test extraction when config has nested objects and braces in strings."""
+        html = """
+        <script>
+        var player = new Playerjs({
+            "id": "player",
+            "title": "Episode {1}",
+            "style": {"color": "#fff"},
+            "file": "https://example.com/video.m3u8"
+        });
+        </script>
+        """
+        result = extractor.extract_url(html)
+        assert result == "https://example.com/video.m3u8"
+
 
 class TestQualitySelection:
     """Test quality selection in M3U8Extractor."""
@@ -171,6 +193,11 @@ class TestQualitySelection:
         result = extractor._select_best_quality(file_value)
         assert result == file_value
 
+    def test_select_best_quality_unmatched_brackets(self, extractor):
+        """Test URL with brackets out of order is returned as-is."""
+        file_value = "https://example.com/]video[.m3u8"
+        assert extractor._select_best_quality(file_value) == file_value
+
 
 class TestExtractorChainInM3U8:
     """Test extractor chain functionality in M3U8Extractor."""
@@ -351,3 +378,75 @@ class TestM3U8Extractor:
         assert result[0].m3u8_url == "https://example.com/video1.m3u8"
         assert result[1].m3u8_url == "https://example.com/video2.m3u8"
         assert result[2].m3u8_url == "https://example.com/video3.m3u8"
+
+    def test_extract_all_m3u8_urls_empty(self, extractor):
+        """Test extraction with no episodes returns empty list."""
+        assert extractor.extract_all_m3u8_urls([]) == []
+
+    @responses.activate
+    def test_iter_m3u8_urls_yields_all(self, extractor):
+        """Test that every episode is yielded with its URL."""
+        episodes = [
+            Episode(number=n, data_id="0_0", data_file=f"https://example.com/ep{n}")
+            for n in (1, 2)
+        ]
+        for n in (1, 2):
+            responses.add(
+                responses.GET,
+                f"https://example.com/ep{n}",
+                body=f"<script>Playerjs({{'file': 'https://v{n}.m3u8'}})</script>"
+                + " " * 100,
+                status=200,
+            )
+
+        result = {ep.number: ep.m3u8_url for ep in extractor.iter_m3u8_urls(episodes)}
+
+        assert result == {1: "https://v1.m3u8", 2: "https://v2.m3u8"}
+
+    def test_iter_m3u8_urls_close_cancels_pending(self, monkeypatch):
+        """Test that closing the generator drops extractions not yet started."""
+        extractor = M3U8Extractor(max_workers=1)
+        calls = []
+
+        def slow_extract(episode):
+            calls.append(episode.number)
+            time.sleep(0.1)
+            return f"https://v{episode.number}.m3u8"
+
+        monkeypatch.setattr(extractor, "extract_m3u8_url", slow_extract)
+        episodes = [
+            Episode(number=n, data_id="0_0", data_file=f"https://example.com/ep{n}")
+            for n in range(1, 6)
+        ]
+
+        results = extractor.iter_m3u8_urls(episodes)
+        next(results)
+        results.close()
+
+        # The finished one and at most the one the worker already picked up
+        assert len(calls) <= 2
+
+    def test_default_session_pool_sized_to_workers(self):
+        """Test that the default session keeps a connection per worker."""
+        extractor = M3U8Extractor(max_workers=24)
+        adapter = extractor.session.get_adapter("https://example.com/")
+        assert adapter._pool_maxsize == 24
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.raise_on_status is False
+
+    @responses.activate
+    def test_extract_m3u8_large_page_truncated(self, extractor, episode):
+        """Test that only the head of a large page is read."""
+        html = '<script>Playerjs({"file": "https://example.com/video.m3u8"})</script>'
+        responses.add(
+            responses.GET,
+            episode.data_file,
+            body=html + " " * (2 * M3U8Extractor.MAX_PAGE_BYTES),
+            status=200,
+        )
+
+        page = extractor._fetch_page(episode.data_file, {})
+        assert page.startswith(html)
+        assert len(page) < 2 * M3U8Extractor.MAX_PAGE_BYTES
+        assert extractor.extract_m3u8_url(episode) == "https://example.com/video.m3u8"
@@ -0,0 +1,191 @@
+"""Tests for HTTP cache and client caching."""
+
+import os
+import time
+from unittest.mock import PropertyMock, patch
+
+import pytest
+import requests
+import responses
+
+from aniloader.core.http_cache import HTTPCache
+from aniloader.core.http_client import HTTPClient
+
+
+class TestHTTPCache:
+    """Test HTTPCache class."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create cache in temporary directory."""
+        return HTTPCache(cache_dir=tmp_path, ttl=60)
+
+    def test_get_missing(self, cache):
+        """Test that missing entry returns None."""
+        assert cache.get(cache.make_key("https://example.com/")) is None
+
+    def test_set_then_get(self, cache):
+        """Test that stored body is returned."""
+        key = cache.make_key("https://example.com/")
+        cache.set(key, "<html>Тест</html>")
+        assert cache.get(key) == "<html>Тест</html>"
+
+    def test_expired_entry(self, cache, tmp_path):
+        """Test that entries older than ttl are ignored."""
+        key = cache.make_key("https://example.com/")
+        cache.set(key, "old")
+        path = next(tmp_path.iterdir())
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.get(key) is None
+
+    def test_corrupted_entry(self, cache, tmp_path):
+        """Test that unreadable entries are treated as a miss."""
+        key = cache.make_key("https://example.com/")
+        (tmp_path / f"{key}.html.gz").write_bytes(b"not gzip")
+        assert cache.get(key) is None
+
+    def test_validators_roundtrip(self, cache):
+        """Test that stored validators become conditional headers."""
+        key = cache.make_key("https://example.com/")
+        cache.set(key, "body", etag='"abc"', last_modified="Mon, 01 Jan 2024")
+        assert cache.get_validators(key) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+
+        cache.set(key, "new body")
+        assert cache.get_validators(key) == {}
+
+
+class TestHTTPClientCache:
+    """Test HTTPClient caching behaviour."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create client with cache in temporary directory."""
+        return HTTPClient(cache=HTTPCache(cache_dir=tmp_path))
+
+    @responses.activate
+    def test_get_text_uses_cache(self, client):
+        """Test that a second fetch is served from cache."""
+        url = "https://example.com/anime.html"
+        responses.add(responses.GET, url, body="page", status=200)
+
+        assert client.get_text(url) == "page"
+        assert client.get_text(url) == "page"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_text_bypass_cache(self, client):
+        """Test that use_cache=False always fetches."""
+        url = "https://example.com/anime.html"
+        responses.add(responses.GET, url, body="page", status=200)
+
+        client.get_text(url, use_cache=False)
+        client.get_text(url, use_cache=False)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_fetch_text_reports_cache_hit(self, client):
+        """Test that fetch_text tells a cached body from a fetched one."""
+        url = "https://example.com/anime.html"
+        responses.add(responses.GET, url, body="page", status=200)
+
+        assert client.fetch_text(url) == ("page", False)
+        assert client.fetch_text(url) == ("page", True)
+        assert client.fetch_text(url, use_cache=False) == ("page", False)
+
+    @responses.activate
+    def test_ajax_playlist_request_not_cached(self, client, tmp_path):
+        """Test that playlist responses are always fetched fresh."""
+        responses.add(
+            responses.POST, HTTPClient.AJAX_PLAYLIST_URL, body="list", status=200
+        )
+
+        client.ajax_playlist_request("1", "hash", "https://example.com/")
+        client.ajax_playlist_request("1", "hash", "https://example.com/")
+        assert len(responses.calls) == 2
+        assert not list(tmp_path.iterdir())
+
+    @responses.activate
+    def test_get_text_revalidates_expired_entry(self, client, tmp_path):
+        """Test that an expired entry is revalidated with a conditional GET."""
+        url = "https://example.com/anime.html"
+        responses.add(responses.GET, url, body="page", headers={"ETag": '"v1"'})
+        client.get_text(url)
+
+        old = time.time() - 24 * 60 * 60
+        for path in tmp_path.glob("*.html.gz"):
+            os.utime(path, (old, old))
+
+        responses.replace(responses.GET, url, status=304)
+        assert client.get_text(url) == "page"
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+        # Revalidated entry is fresh again
+        assert client.get_text(url) == "page"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_ajax_playlist_request_skips_charset_detection(self, client):
+        """Test that a body without declared charset is decoded as UTF-8."""
+        responses.add(
+            responses.POST,
+            HTTPClient.AJAX_PLAYLIST_URL,
+            body='{"response": "Озвучення"}'.encode("utf-8"),
+            content_type=None,
+        )
+
+        with patch.object(
+            requests.Response, "apparent_encoding", new_callable=PropertyMock
+        ) as detect:
+            body = client.ajax_playlist_request("1", "hash", "https://example.com/")
+
+        assert body == '{"response": "Озвучення"}'
+        detect.assert_not_called()
+
+    @responses.activate
+    def test_get_text_without_charset_is_utf8(self, client):
+        """Test that text/html without a declared charset is decoded as UTF-8."""
+        responses.add(
+            responses.GET,
+            "https://anitube.in.ua/1234-test.html",
+            body="<h1>Озвучення</h1>".encode("utf-8"),
+            content_type="text/html",
+        )
+
+        html = client.get_text("https://anitube.in.ua/1234-test.html", use_cache=False)
+
+        assert html == "<h1>Озвучення</h1>"
+
+
+class TestHTTPClientRetries:
+    """Test HTTPClient retry behaviour."""
+
+    @pytest.fixture
+    def client(self):
+        """Create client without cache."""
+        return HTTPClient()
+
+    @responses.activate
+    def test_session_retries_gateway_errors(self, client):
+        """Test that a transient 503 is retried on the shared session."""
+        url = "https://example.com/player"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, body="ok")
+
+        with patch("urllib3.util.retry.Retry.sleep"):
+            assert client.session.get(url).text == "ok"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_exhausted_retries_raise_http_error(self, client):
+        """Test that persistent 503s end in HTTPError, not RetryError."""
+        url = "https://example.com/anime.html"
+        responses.add(responses.GET, url, status=503)
+
+        with patch("urllib3.util.retry.Retry.sleep"):
+            with pytest.raises(requests.HTTPError):
+                client.get(url)
+        assert len(responses.calls) == 4
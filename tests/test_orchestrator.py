@@ -0,0 +1,124 @@
+"""Tests for orchestrator module."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from aniloader.cli.orchestrator import DownloadOrchestrator
+from aniloader.models import Anime, Episode, Voice
+
+
+class TestDownloadOrchestrator:
+    """Test DownloadOrchestrator class."""
+
+    @pytest.fixture
+    def anime(self):
+        """Create movie with one voice and three episodes."""
+        return Anime(
+            news_id="1234",
+            title_en="Test Anime",
+            is_movie=True,
+            voices=[Voice(id="0_0", name="Test Voice")],
+            episodes=[
+                Episode(number=n, data_id="0_0", data_file=f"https://ep{n}")
+                for n in (1, 2, 3)
+            ],
+        )
+
+    @pytest.fixture
+    def orchestrator(self, anime, tmp_path):
+        """Create orchestrator with mocked dependencies."""
+        scraper = MagicMock()
+        scraper.fetch_anime_metadata.return_value = anime
+        scraper.fetch_playlist.return_value = anime
+
+        def iter_m3u8_urls(episodes):
+            for episode in episodes:
+                # Episode 2 fails extraction
+                if episode.number != 2:
+                    episode.m3u8_url = f"https://video{episode.number}.m3u8"
+                yield episode
+
+        extractor = MagicMock()
+        extractor.iter_m3u8_urls.side_effect = iter_m3u8_urls
+
+        downloader = MagicMock()
+        downloader.create_output_directory.return_value = tmp_path
+        downloader.is_downloaded.return_value = False
+        downloader.download_episode.side_effect = lambda anime, ep, path: (
+            ep.number == 1,
+            f"episode {ep.number}",
+        )
+
+        return DownloadOrchestrator(
+            scraper=scraper,
+            extractor=extractor,
+            downloader=downloader,
+            selector=MagicMock(),
+        )
+
+    def test_run_downloads_extracted_episodes(self, orchestrator):
+        """Test that only episodes with extracted URLs are downloaded."""
+        stats = orchestrator.run("https://anitube.in.ua/1234-test.html", voice_index=1)
+
+        downloaded = [
+            call.args[1].number
+            for call in orchestrator.downloader.download_episode.call_args_list
+        ]
+        assert sorted(downloaded) == [1, 3]
+        assert stats == {"successful": 1, "failed": 1, "skipped": 0}
+
+    def test_run_skips_existing_before_extraction(self, orchestrator):
+        """Test that existing episodes are not extracted or downloaded."""
+        orchestrator.downloader.is_downloaded.side_effect = (
+            lambda anime, ep, path, existing=None: ep.number == 3
+        )
+
+        stats = orchestrator.run("https://anitube.in.ua/1234-test.html", voice_index=1)
+
+        extracted = orchestrator.extractor.iter_m3u8_urls.call_args.args[0]
+        assert [ep.number for ep in extracted] == [1, 2]
+        assert stats == {"successful": 1, "failed": 0, "skipped": 1}
+
+    def test_run_all_already_downloaded(self, orchestrator):
+        """Test that nothing is fetched when all episodes exist."""
+        orchestrator.downloader.is_downloaded.return_value = True
+
+        stats = orchestrator.run("https://anitube.in.ua/1234-test.html", voice_index=1)
+
+        orchestrator.extractor.iter_m3u8_urls.assert_not_called()
+        assert stats == {"successful": 0, "failed": 0, "skipped": 3}
+
+    def test_run_interrupt_cancels_queued_downloads(self, orchestrator):
+        """Test that Ctrl+C doesn't start downloads that are still queued."""
+
+        def iter_m3u8_urls(episodes):
+            for episode in episodes:
+                episode.m3u8_url = f"https://video{episode.number}.m3u8"
+                yield episode
+            raise KeyboardInterrupt
+
+        def slow_download(anime, ep, path):
+            time.sleep(0.2)
+            return True, "ok"
+
+        orchestrator.extractor.iter_m3u8_urls.side_effect = iter_m3u8_urls
+        orchestrator.downloader.download_episode.side_effect = slow_download
+
+        orchestrator.parallel_episodes = 1
+        with pytest.raises(KeyboardInterrupt):
+            orchestrator.run("https://anitube.in.ua/1234-test.html", voice_index=1)
+
+        assert orchestrator.downloader.download_episode.call_count == 1
+
+    def test_run_no_extracted_urls(self, orchestrator):
+        """Test that nothing is downloaded when extraction fails."""
+        orchestrator.extractor.iter_m3u8_urls.side_effect = lambda episodes: iter(
+            episodes
+        )
+
+        stats = orchestrator.run("https://anitube.in.ua/1234-test.html", voice_index=1)
+
+        orchestrator.downloader.download_episode.assert_not_called()
+        assert stats == {"successful": 0, "failed": 0, "skipped": 0}
@@ -1,7 +1,11 @@
 """Tests for scraper module."""
 
+import json
+from unittest.mock import MagicMock, patch
+
 import pytest
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from aniloader.scraper_refactored import AnitubeScraper
 from aniloader.parsing.content_detector import ContentTypeDetector
@@ -19,6 +23,67 @@ class TestAnitubeScraper:
         """Create scraper instance."""
         return AnitubeScraper()
 
+    def test_rejected_playlist_refetches_cached_page(self, mock_playlist_html):
+        """Test that a cached page is refetched when its playlist is rejected."""
+        http_client = MagicMock()
+        http_client.fetch_text.side_effect = [
+            ("<script>var dle_login_hash = 'old';</script>", True),
+            ("<script>var dle_login_hash = 'new';</script>", False),
+        ]
+        playlist = mock_playlist_html(
+            players=[("0_0", "ОЗВУЧКА")],
+            episodes=[
+                ("0_0", "1 серія", "https://example.com/ep1"),
+                ("0_0", "2 серія", "https://example.com/ep2"),
+            ],
+        )
+        http_client.ajax_playlist_request.side_effect = [
+            '{"success": false}',
+            json.dumps({"success": True, "response": playlist}),
+        ]
+        scraper = AnitubeScraper(http_client=http_client)
+
+        anime = scraper.fetch_anime_metadata("https://anitube.in.ua/1234-test.html")
+
+        assert http_client.fetch_text.call_args.kwargs == {"use_cache": False}
+        assert http_client.ajax_playlist_request.call_args.kwargs["user_hash"] == "new"
+        assert anime.is_movie is False
+        assert len(anime.episodes) == 2
+
+    def test_rejected_playlist_fresh_page_falls_back(self):
+        """Test that a freshly fetched page goes straight to the iframe fallback."""
+        page = '<iframe src="//ashdi.vip/player/1"></iframe>'
+        http_client = MagicMock()
+        http_client.fetch_text.return_value = (page, False)
+        http_client.get_text.return_value = page
+        http_client.ajax_playlist_request.return_value = '{"success": false}'
+        scraper = AnitubeScraper(http_client=http_client)
+
+        anime = scraper.fetch_anime_metadata("https://anitube.in.ua/1234-test.html")
+
+        assert http_client.fetch_text.call_count == 1
+        assert http_client.ajax_playlist_request.call_count == 1
+        assert anime.is_movie is True
+        assert anime.episodes[0].data_file == "https://ashdi.vip/player/1"
+
+    def test_embedded_iframe_fallback_reuses_page(self):
+        """Test that the iframe fallback doesn't fetch the anime page again."""
+        http_client = MagicMock()
+        http_client.fetch_text.return_value = (
+            '<html><h1>Old</h1><iframe src="//ashdi.vip/player/1"></iframe></html>',
+            False,
+        )
+        http_client.ajax_playlist_request.return_value = '{"success": false}'
+        scraper = AnitubeScraper(http_client=http_client)
+
+        anime = scraper.fetch_anime_metadata(
+            "https://anitube.in.ua/1234-old-anime.html"
+        )
+
+        assert http_client.fetch_text.call_count == 1
+        http_client.get_text.assert_not_called()
+        assert anime.episodes[0].data_file == "https://ashdi.vip/player/1"
+
 
 class TestContentTypeDetector:
     """Test ContentTypeDetector class."""
@@ -167,6 +232,28 @@ class TestVoiceExtractor:
         assert len(voices) == 2
         assert all("ОЗВУЧЕННЯ" not in v.name for v in voices)
 
+    def test_extract_voices_uses_parser_flags(self, extractor):
+        """Test that keyword flags from HTMLParser are used as-is."""
+        all_items = [
+            {
+                "id": "0_0",
+                "name": "ТОНІС",
+                "parts_count": 2,
+                "is_player": False,
+                "is_category": False,
+            },
+            {
+                "id": "0_1",
+                "name": "MOON",
+                "parts_count": 2,
+                "is_player": True,
+                "is_category": False,
+            },
+        ]
+        voices = extractor.extract_voices(all_items, is_movie=False, max_depth=2)
+
+        assert [v.id for v in voices] == ["0_0"]
+
 
 class TestHTMLParser:
     """Test HTMLParser class."""
@@ -209,6 +296,33 @@ class TestHTMLParser:
         assert len(items) == 1
         assert items[0]["name"] == "Valid"
 
+    def test_parse_voice_items_nested_markup(self, parser):
+        """Test that item names join stripped text of nested tags."""
+        html = """
+        <div class="playlists-player playlists-lists">
+            <ul class="playlists-items">
+                <li data-id="0_0"> <span> ПЛЕЄР </span><!-- x --> ASHDI </li>
+            </ul>
+        </div>
+        """
+        items = parser.parse_voice_items(html)
+        assert items == [
+            {
+                "id": "0_0",
+                "name": "ПЛЕЄРASHDI",
+                "parts_count": 2,
+                "is_player": True,
+                "is_category": False,
+            }
+        ]
+
+    def test_parse_playlist_empty_html(self, parser):
+        """Test that empty playlist HTML yields no items."""
+        assert parser.parse_voice_items("") == []
+        assert parser.parse_episode_items("", "0_0") == []
+        assert parser.get_episode_texts("") == []
+        assert parser.get_unique_episode_files("") == set()
+
     def test_parse_episode_items(self, parser, mock_playlist_html):
         """Test parsing episode items for a player."""
         html = mock_playlist_html(
@@ -273,6 +387,26 @@ class TestHTMLParser:
         assert "https://file1.com" in files
         assert "https://file2.com" in files
 
+    def test_parse_playlist_single_parse(self, parser, mock_playlist_html):
+        """Test that the per-item helpers share one parse of the playlist."""
+        html = mock_playlist_html(
+            players=[("0_0", "ПЛЕЄР ASHDI")],
+            episodes=[("0_0_0", "1 серія", "https://ep1")],
+        )
+        playlist = parser.parse_playlist(html)
+
+        assert playlist.voice_items[0]["id"] == "0_0"
+        assert playlist.episode_texts == ["1 серія"]
+        assert playlist.unique_files == {"https://ep1"}
+        assert playlist.max_depth == parser.get_max_depth(playlist.voice_items)
+        assert playlist.all_players is True
+
+        with patch("aniloader.parsing.html_parser.etree.HTML") as mock_html:
+            assert parser.parse_voice_items(html) is playlist.voice_items
+            assert parser.get_episode_texts(html) is playlist.episode_texts
+            assert len(parser.parse_episode_items(html, "0_0")) == 1
+        mock_html.assert_not_called()
+
     def test_get_max_depth(self, parser):
         """Test getting max depth from items."""
         items = [
@@ -336,6 +470,35 @@ class TestHTMLParser:
         # No matching iframe (regex won't match empty src)
         assert parser.find_embedded_iframe(html) is None
 
+    def test_find_embedded_iframe_skips_other_iframes(self, parser):
+        """Test that non-player iframes before the player are ignored."""
+        html = """
+        <html><body>
+            <iframe src="https://www.youtube.com/embed/trailer"></iframe>
+            <iframe src="https://ashdi.vip/player/12345"></iframe>
+        </body></html>
+        """
+        url = parser.find_embedded_iframe(html)
+        assert url == "https://ashdi.vip/player/12345"
+
+    def test_find_embedded_iframe_parsed_page(self, parser):
+        """Test that a parsed page is searched without parsing it again."""
+        page = parser.parse_page(
+            '<iframe src="https://youtube.com/embed/x"></iframe>'
+            '<iframe src="//ashdi.vip/player/1"></iframe>'
+        )
+        assert page.tree is page.tree
+
+        assert parser.find_embedded_iframe(page) == "https://ashdi.vip/player/1"
+
+    def test_parsed_page_tree_with_encoding_declaration(self, parser):
+        """Test that a page starting with an XML declaration gets a tree."""
+        page = parser.parse_page(
+            '<?xml version="1.0" encoding="windows-1251"?>'
+            "<html><body><h1>Наруто</h1></body></html>"
+        )
+        assert page.tree.findtext(".//h1") == "Наруто"
+
 
 class TestVoicePlayerParsing:
     """Test voice and player parsing integration."""
@@ -345,6 +508,41 @@ class TestVoicePlayerParsing:
         """Create scraper instance."""
         return AnitubeScraper()
 
+    @pytest.fixture
+    def mock_http_scraper(self, mock_playlist_html):
+        """Create scraper with mocked HTTP client returning a series playlist."""
+        http_client = MagicMock()
+        http_client.fetch_text.return_value = (
+            "<html><h1>Test Anime</h1></html>",
+            False,
+        )
+        http_client.ajax_playlist_request.return_value = mock_playlist_html(
+            players=[("0_0", "ПЛЕЄР ASHDI"), ("0_1", "ПЛЕЄР TRG")],
+            episodes=[
+                ("0_0", "1 серія", "https://example.com/ashdi1"),
+                ("0_0", "2 серія", "https://example.com/ashdi2"),
+                ("0_1", "1 серія", "https://example.com/trg1"),
+            ],
+        )
+        return AnitubeScraper(http_client=http_client)
+
+    def test_fetch_playlist_reuses_response(self, mock_http_scraper):
+        """Test that selecting a voice doesn't request the playlist again."""
+        anime = mock_http_scraper.fetch_anime_metadata(
+            "https://anitube.in.ua/1234-test-anime.html"
+        )
+        anime = mock_http_scraper.fetch_playlist(anime, voice_id="0_1")
+
+        assert mock_http_scraper.http_client.ajax_playlist_request.call_count == 1
+        assert [ep.data_file for ep in anime.episodes] == ["https://example.com/trg1"]
+
+    def test_fetch_anime_metadata_resets_playlist(self, mock_http_scraper):
+        """Test that a new anime page triggers a new playlist request."""
+        mock_http_scraper.fetch_anime_metadata("https://anitube.in.ua/1-a.html")
+        mock_http_scraper.fetch_anime_metadata("https://anitube.in.ua/2-b.html")
+
+        assert mock_http_scraper.http_client.ajax_playlist_request.call_count == 2
+
     def test_simple_player_structure(self, mock_playlist_html):
         """Test parsing simple structure where players are at top level."""
         html = mock_playlist_html(
@@ -520,8 +718,8 @@ class TestMetadataExtractor:
             <a href="https://twitter.com/intent/tweet?text=Українська%20Назва%20/%20English%20Title%20https://example.com">Share</a>
         </body></html>
         """
-        soup = BeautifulSoup(html, "lxml")
-        title = extractor.extract_title(soup)
+        root = etree.HTML(html)
+        title = extractor.extract_title(root)
         assert title == "English Title"
 
     def test_extract_title_from_og_tag(self, extractor):
@@ -534,8 +732,8 @@ class TestMetadataExtractor:
         <body></body>
         </html>
         """
-        soup = BeautifulSoup(html, "lxml")
-        title = extractor.extract_title(soup)
+        root = etree.HTML(html)
+        title = extractor.extract_title(root)
         assert title == "Anime Title from OG"
 
     def test_extract_title_from_h1(self, extractor):
@@ -545,15 +743,15 @@ class TestMetadataExtractor:
             <h1 class="title">Title from H1</h1>
         </body></html>
         """
-        soup = BeautifulSoup(html, "lxml")
-        title = extractor.extract_title(soup)
+        root = etree.HTML(html)
+        title = extractor.extract_title(root)
         assert title == "Title from H1"
 
     def test_extract_title_unknown(self, extractor):
         """Test default title when none found."""
         html = "<html><body></body></html>"
-        soup = BeautifulSoup(html, "lxml")
-        title = extractor.extract_title(soup)
+        root = etree.HTML(html)
+        title = extractor.extract_title(root)
         assert title == "Unknown"
 
     def test_extract_season_with_season_keyword(self, extractor):
@@ -585,8 +783,8 @@ class TestMetadataExtractor:
         <body></body>
         </html>
         """
-        soup = BeautifulSoup(html, "lxml")
-        year = extractor.extract_year(soup)
+        root = etree.HTML(html)
+        year = extractor.extract_year(root)
         assert year == 2023
 
     def test_extract_year_from_content(self, extractor):
@@ -596,15 +794,26 @@ class TestMetadataExtractor:
             <p>Released in 2024</p>
         </body></html>
         """
-        soup = BeautifulSoup(html, "lxml")
-        year = extractor.extract_year(soup)
+        root = etree.HTML(html)
+        year = extractor.extract_year(root)
         assert year == 2024
 
+    def test_extract_year_ignores_scripts_and_comments(self, extractor):
+        """Test that years in scripts and comments are not used."""
+        html = """
+        <html><head><script>var built = 2019;</script></head><body>
+            <!-- cached 2018 -->
+            <p>Released in 2024</p>
+        </body></html>
+        """
+        root = etree.HTML(html)
+        assert extractor.extract_year(root) == 2024
+
     def test_extract_year_not_found(self, extractor):
         """Test None when year not found."""
         html = "<html><body>No year here</body></html>"
-        soup = BeautifulSoup(html, "lxml")
-        year = extractor.extract_year(soup)
+        root = etree.HTML(html)
+        year = extractor.extract_year(root)
         assert year is None
 
     def test_get_base_title_removes_season(self, extractor):
@@ -746,3 +955,41 @@ class TestEpisodeExtractor:
 
         # Should find the episode with direct match
         assert len(episodes) == 1
+
+    def test_extract_series_direct_episodes_after_players(self, extractor):
+        """Test that a direct match wins over an earlier child player."""
+        episode_items = [
+            {"data_id": "0_0_0", "data_file": "https://child.com", "number": 1},
+            {"data_id": "0_0", "data_file": "https://direct.com", "number": 2},
+        ]
+
+        episodes = extractor.extract_episodes(
+            episode_items=episode_items,
+            voice_id="0_0",
+            player_id=None,
+            is_movie=False,
+            all_items=[],
+        )
+
+        # voice_id itself is the player, and child ids share its prefix
+        assert [ep.data_file for ep in episodes] == [
+            "https://child.com",
+            "https://direct.com",
+        ]
+
+    def test_extract_series_first_player_under_voice(self, extractor):
+        """Test that the first player under the voice is selected."""
+        episode_items = [
+            {"data_id": "0_0_1", "data_file": "https://p1.com", "number": 1},
+            {"data_id": "0_0_0", "data_file": "https://p0.com", "number": 1},
+        ]
+
+        episodes = extractor.extract_episodes(
+            episode_items=episode_items,
+            voice_id="0_0",
+            player_id=None,
+            is_movie=False,
+            all_items=[],
+        )
+
+        assert [ep.data_file for ep in episodes] == ["https://p1.com"]
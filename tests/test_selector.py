@@ -3,19 +3,53 @@
 import pytest
 from unittest.mock import patch
 
+from aniloader.cli import selector as selector_module
 from aniloader.cli.selector import InteractiveSelector
-from aniloader.exceptions import NoVoicesError, NoPlayersError, UserCancelledError
+from aniloader.exceptions import (
+    NoVoicesError,
+    NoPlayersError,
+    NoTerminalError,
+    UserCancelledError,
+)
 from aniloader.models import Voice, Player
 
 
 class TestInteractiveSelector:
     """Test InteractiveSelector class."""
 
+    @pytest.fixture(autouse=True)
+    def tty_stdin(self, monkeypatch):
+        """Pretend stdin is an interactive terminal."""
+        monkeypatch.setattr(selector_module.sys.stdin, "isatty", lambda: True)
+
     @pytest.fixture
     def selector(self):
         """Create selector instance."""
         return InteractiveSelector()
 
+    @patch("builtins.input")
+    def test_select_voice_no_tty(self, mock_input, selector, monkeypatch):
+        """Test that voice selection fails instead of blocking without a TTY."""
+        monkeypatch.setattr(selector_module.sys.stdin, "isatty", lambda: False)
+        voices = [
+            Voice(id="0_0", name="Voice 1"),
+            Voice(id="0_1", name="Voice 2"),
+        ]
+        with pytest.raises(NoTerminalError):
+            selector.select_voice(voices)
+        mock_input.assert_not_called()
+
+    @patch("builtins.input")
+    def test_select_player_no_tty(self, mock_input, selector, monkeypatch):
+        """Test that first player is used without a TTY."""
+        monkeypatch.setattr(selector_module.sys.stdin, "isatty", lambda: False)
+        players = [
+            Player(id="0_0_0", name="Player 1"),
+            Player(id="0_0_1", name="Player 2"),
+        ]
+        assert selector.select_player(players) == players[0]
+        mock_input.assert_not_called()
+
     def test_select_voice_single_voice(self, selector, capsys):
         """Test that single voice is auto-selected."""
         voices = [Voice(id="0_0", name="Test Voice")]